@@ -1,21 +1,83 @@
-from dotenv import load_dotenv
-from fastapi import HTTPException
-from mongoengine import connect,connection
-import os
+import asyncio
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
+from settings import settings
 
-load_dotenv()
+_motor_client = None
+_database = None
+_list_read_preference = None
 
-MONGO_URL=os.getenv("MONGODB_URL")
+def client_options(settings) -> dict:
+    return {
+        "maxPoolSize": settings.mongo_max_pool_size,
+        "minPoolSize": settings.mongo_min_pool_size,
+        "connectTimeoutMS": settings.mongo_connect_timeout_ms,
+        "socketTimeoutMS": settings.mongo_socket_timeout_ms,
+        "serverSelectionTimeoutMS": settings.mongo_server_selection_timeout_ms,
+        "waitQueueTimeoutMS": settings.mongo_wait_queue_timeout_ms or None,
+        "readPreference": settings.mongo_read_preference,
+        **write_concern_options(settings),
+    }
 
-def init_db():
-    try:
-        if not MONGO_URL:
-              raise HTTPException(status_code=400, detail="MongoDB URL not found")
-        connect(host=MONGO_URL)
-        client = connection.get_connection()
-        client.admin.command('ping')
-    except ConnectionError as ce:
-         raise HTTPException(status_code=500,detail="Failed To Connect to DataBase "+str(ce))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def write_concern_options(settings) -> dict:
+    if not settings.mongo_write_concern:
+        return {}
+    w = settings.mongo_write_concern
+    options = {"w": int(w) if w.isdigit() else w}
+    if settings.mongo_write_concern_timeout_ms:
+        options["wTimeoutMS"] = settings.mongo_write_concern_timeout_ms
+    return options
+
+def read_preference(name: str):
+    """pymongo read preference for a mode name such as "secondaryPreferred"; raises ValueError if unknown."""
+    return make_read_preference(read_pref_mode_from_name(name), None)
+
+async def connect_db(settings=settings):
+    """Creates the Motor client (and its pool) inside the running worker.
+
+    Called from the app lifespan, i.e. after any fork, so workers never share sockets.
+    No round-trip happens here; check_db() does the first one.
+    """
+    global _motor_client, _database, _list_read_preference
+    if settings.mongo_list_read_preference != settings.mongo_read_preference:
+        _list_read_preference = read_preference(settings.mongo_list_read_preference)
+    if _database is not None:
+        # a database injected with set_database (tests, benchmarks) replaces the server connection
+        return
+    if not settings.mongo_url:
+        raise RuntimeError("MONGODB_URL is not set")
+    from motor.motor_asyncio import AsyncIOMotorClient
+    _motor_client = AsyncIOMotorClient(settings.mongo_url, **client_options(settings))
+    _database = _motor_client.get_default_database("test")
+
+async def check_db():
+    """Pings the server, raising the driver's error when it cannot be reached."""
+    await get_database().command("ping")
 
+def list_read_preference():
+    """Read preference for list/count reads when it differs from the client default, else None."""
+    return _list_read_preference
+
+def close_db():
+    global _motor_client, _database, _list_read_preference
+    _list_read_preference = None
+    if _motor_client is not None:
+        _motor_client.close()
+        _motor_client = None
+        _database = None
+
+def get_database():
+    if _database is None:
+        raise RuntimeError("Database not connected; connect_db() runs in the app lifespan")
+    return _database
+
+def set_database(database):
+    """Point the repositories at another database, e.g. mongomock_motor.AsyncMongoMockClient()["test"]."""
+    global _database
+    _database = database
+
+async def ping_db(timeout: float) -> bool:
+    try:
+        await asyncio.wait_for(get_database().command("ping"), timeout)
+        return True
+    except Exception:
+        return False
@@ -0,0 +1,72 @@
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.exception_handlers import http_exception_handler, request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from exceptions import project_exception, user_exception
+from metrics.registry import Counter
+
+api_errors_total = Counter("app_api_errors_total", "Error responses by status and error_code", ("status", "error_code"))
+
+INTERNAL_ERROR_BODY = orjson.dumps({"detail": "Internal server error", "error_code": "INTERNAL_SERVER_ERROR"})
+
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def _error_body(exc) -> bytes:
+    return orjson.dumps({"detail": exc.detail, "error_code": exc.error_code})
+
+
+def precompute_bodies() -> dict:
+    """ErrorResponse bytes for every exception whose detail is fixed (no constructor arguments)."""
+    bodies = {}
+    for base in (project_exception.BaseAPIException, user_exception.BaseAPIException):
+        for cls in _subclasses(base):
+            try:
+                exc = cls()
+            except TypeError:
+                # detail supplied per raise, e.g. InvalidInputException(detail=...)
+                continue
+            bodies[cls] = (exc.detail, _error_body(exc))
+    return bodies
+
+
+ERROR_BODIES = precompute_bodies()
+
+
+async def api_exception_handler(request: Request, exc) -> Response:
+    api_errors_total.inc((str(exc.status_code), exc.error_code))
+    precomputed = ERROR_BODIES.get(type(exc))
+    body = precomputed[1] if precomputed and precomputed[0] == exc.detail else _error_body(exc)
+    return Response(content=body, status_code=exc.status_code, media_type="application/json",
+                    headers=getattr(exc, "headers", None))
+
+
+async def counted_http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    # HTTPExceptions raised without an error_code, e.g. by JWTBearer, keep FastAPI's {"detail": ...} body
+    api_errors_total.inc((str(exc.status_code), f"HTTP_{exc.status_code}"))
+    return await http_exception_handler(request, exc)
+
+
+async def counted_validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
+    api_errors_total.inc(("422", "REQUEST_VALIDATION_ERROR"))
+    return await request_validation_exception_handler(request, exc)
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
+    # Starlette re-raises after sending this, so the traceback still reaches the server log
+    api_errors_total.inc(("500", "INTERNAL_SERVER_ERROR"))
+    return Response(content=INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
+
+
+def register_exception_handlers(app: FastAPI):
+    app.add_exception_handler(project_exception.BaseAPIException, api_exception_handler)
+    app.add_exception_handler(user_exception.BaseAPIException, api_exception_handler)
+    app.add_exception_handler(StarletteHTTPException, counted_http_exception_handler)
+    app.add_exception_handler(RequestValidationError, counted_validation_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
@@ -1,11 +1,11 @@
 from fastapi import HTTPException
 
 class BaseAPIException(HTTPException):
-    def __init__(self, status_code: int, detail: str, error_code: str):
+    def __init__(self, status_code: int, detail: str, error_code: str, headers: dict = None): # type: ignore
         self.status_code = status_code
         self.detail = detail
         self.error_code = error_code
-        super().__init__(status_code=status_code, detail=detail)
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
 
 class UserAlreadyExistsException(BaseAPIException):
     def __init__(self):
@@ -62,3 +62,29 @@ class UsernameAndPasswordRequired(BaseAPIException):
             detail="Both username and password are required for this operation. Please provide both to proceed.",
             error_code="USERNAME_AND_PASSWORD_REQUIRED"
         )
+
+class ServiceBusyException(BaseAPIException):
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            status_code=503,
+            detail="The server is busy processing other requests. Please retry shortly.",
+            error_code="SERVICE_BUSY",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+class InvalidRefreshTokenException(BaseAPIException):
+    def __init__(self):
+        super().__init__(
+            status_code=401,
+            detail="The refresh token is invalid, expired or has already been used. Please log in again.",
+            error_code="INVALID_REFRESH_TOKEN"
+        )
+
+class TooManyRequestsException(BaseAPIException):
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            status_code=429,
+            detail="Too many attempts. Please wait before trying again.",
+            error_code="TOO_MANY_REQUESTS",
+            headers={"Retry-After": str(retry_after)}
+        )
@@ -0,0 +1,63 @@
+from typing import NamedTuple, Optional
+from fastapi import Depends
+from jwt_auth.token_validation import JWTBearer, token_revoked
+from jwt_auth.token_revocation import is_token_version_revoked
+from jwt_auth.principal_cache import Principal, principal_cache
+from jwt_auth.policy import PERMISSION_BITS, permission_bit, role_has
+from repository.user_repository import user_repository
+from metrics.registry import timed
+from exceptions.project_exception import UserNotFoundException, UserNotFound, UnauthorizedActionException
+
+@timed("get_user_from_token")
+async def get_user_from_token(token_payload: dict) -> Principal:
+    user_id = token_payload.get("sub")
+    if not user_id:
+        raise UserNotFoundException()
+    if token_payload.get("authz") == "claims":
+        return Principal(id=user_id, username=token_payload["username"], role=token_payload["role"], token_version=token_payload.get("tv", 0))
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        user = await user_repository.get_by_id(user_id)
+        if not user:
+            raise UserNotFound()
+        principal = Principal(id=str(user.id), username=user.username, role=user.role, token_version=user.token_version or 0)
+        principal_cache.set(user_id, principal)
+    if token_payload.get("ver", 1) >= 2:
+        # the cached principal may predate a bump made by another worker; the synced versions do not
+        token_version = token_payload.get("tv", 0)
+        if token_version < principal.token_version or is_token_version_revoked(user_id, token_version):
+            raise token_revoked()
+    return principal
+
+def require(permission: str):
+    """FastAPI dependency resolving the caller and checking one permission bit of their role."""
+    bit = permission_bit(permission)
+
+    async def dependency(token_payload: dict = Depends(JWTBearer())) -> Principal:
+        principal = await get_user_from_token(token_payload)
+        if not role_has(principal.role, bit):
+            raise UnauthorizedActionException()
+        return principal
+
+    return dependency
+
+class ProjectAccess(NamedTuple):
+    principal: Principal
+    # None when the caller may act on any project, else the only owner id they may act on
+    owner_id: Optional[str]
+
+def require_owned(permission: str):
+    """Like require(), but roles holding only "<permission>:own" are admitted, scoped to their own projects."""
+    bit = permission_bit(permission)
+    # policies written before ownership existed may not define the ":own" variant
+    own_bit = PERMISSION_BITS.get(permission + ":own", 0)
+
+    async def dependency(token_payload: dict = Depends(JWTBearer())) -> ProjectAccess:
+        principal = await get_user_from_token(token_payload)
+        if role_has(principal.role, bit):
+            return ProjectAccess(principal, None)
+        if role_has(principal.role, own_bit):
+            return ProjectAccess(principal, principal.id)
+        raise UnauthorizedActionException()
+
+    return dependency
@@ -0,0 +1,89 @@
+import json
+from typing import Optional
+import jwt
+from jwt.algorithms import get_default_algorithms
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+# JWT_KEYS_FILE: JSON list of {"kid", "alg", and either "secret" (HS*) or
+# "private_key_file"/"public_key_file" PEM paths (RS*/ES*/EdDSA)}.
+# JWT_SIGNING_KID picks the key new tokens are signed with; every key in the ring verifies.
+JWT_KEYS_FILE = os.getenv("JWT_KEYS_FILE")
+JWT_SIGNING_KID = os.getenv("JWT_SIGNING_KID")
+
+ALGORITHMS = get_default_algorithms()
+
+
+class JWTKey:
+    """One key of the ring with its PEMs parsed into key objects exactly once."""
+
+    def __init__(self, kid: str, algorithm: str, signing_key, verifying_key):
+        self.kid = kid
+        self.algorithm = algorithm
+        self.signing_key = signing_key
+        self.verifying_key = verifying_key
+
+    @property
+    def is_symmetric(self) -> bool:
+        return self.algorithm.startswith("HS")
+
+    @classmethod
+    def from_config(cls, entry: dict) -> "JWTKey":
+        algorithm = entry["alg"]
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unsupported JWT algorithm '{algorithm}' for kid '{entry['kid']}'")
+        handler = ALGORITHMS[algorithm]
+        if algorithm.startswith("HS"):
+            key = handler.prepare_key(entry["secret"])
+            return cls(entry["kid"], algorithm, key, key)
+        signing_key = verifying_key = None
+        if entry.get("private_key_file"):
+            with open(entry["private_key_file"], "rb") as f:
+                signing_key = handler.prepare_key(f.read())
+        if entry.get("public_key_file"):
+            with open(entry["public_key_file"], "rb") as f:
+                verifying_key = handler.prepare_key(f.read())
+        elif signing_key is not None:
+            verifying_key = signing_key.public_key()
+        if verifying_key is None:
+            raise ValueError(f"No key material configured for kid '{entry['kid']}'")
+        return cls(entry["kid"], algorithm, signing_key, verifying_key)
+
+    def public_jwk(self) -> dict:
+        jwk = json.loads(ALGORITHMS[self.algorithm].to_jwk(self.verifying_key))
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+
+class KeyRing:
+    def __init__(self, keys, signing_kid: Optional[str] = None):
+        if not keys:
+            raise ValueError("JWT key ring is empty")
+        self.keys = {key.kid: key for key in keys}
+        self.signing_key = self.keys[signing_kid] if signing_kid else keys[0]
+        if self.signing_key.signing_key is None:
+            raise ValueError(f"Signing kid '{self.signing_key.kid}' has no private key")
+        # built once; shared secrets are never published
+        self.jwks = {"keys": [key.public_jwk() for key in keys if not key.is_symmetric]}
+
+    def sign(self, payload: dict) -> str:
+        key = self.signing_key
+        return jwt.encode(payload, key.signing_key, algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def decode(self, token: str) -> dict:
+        kid = jwt.get_unverified_header(token).get("kid")
+        # tokens minted before the ring existed carry no kid
+        key = self.keys.get(kid) if kid else self.signing_key
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key '{kid}'")
+        return jwt.decode(token, key.verifying_key, algorithms=[key.algorithm])
+
+
+def load_keyring(default_secret: str, default_algorithm: str) -> KeyRing:
+    if not JWT_KEYS_FILE:
+        return KeyRing([JWTKey.from_config({"kid": "default", "alg": default_algorithm, "secret": default_secret})])
+    with open(JWT_KEYS_FILE) as f:
+        entries = json.load(f)
+    return KeyRing([JWTKey.from_config(entry) for entry in entries], signing_kid=JWT_SIGNING_KID)
@@ -0,0 +1,84 @@
+import json
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+# role -> roles it inherits from and permissions it adds on top.
+# Override with RBAC_POLICY_FILE (same shape, JSON) to add roles without touching routes.
+DEFAULT_POLICY = {
+    "user": {
+        "inherits": [],
+        # ":own" permissions only apply to projects the caller owns
+        "permissions": ["projects:read", "projects:update:own", "projects:delete:own"],
+    },
+    "admin": {
+        "inherits": ["user"],
+        "permissions": ["projects:create", "projects:update", "projects:delete", "projects:export", "diagnostics:read"],
+    },
+}
+
+
+# permissions the routes check with require(); a policy must grant each to at least one role.
+# ":own" variants are optional, roles without them simply get no ownership-scoped access.
+REQUIRED_PERMISSIONS = ("projects:read", "projects:create", "projects:update", "projects:delete",
+                        "projects:export", "diagnostics:read")
+
+
+def load_policy(path: str = None) -> dict: # type: ignore
+    path = path or os.getenv("RBAC_POLICY_FILE")
+    if not path:
+        return DEFAULT_POLICY
+    with open(path) as f:
+        return json.load(f)
+
+
+def compile_policy(policy: dict, required: tuple = REQUIRED_PERMISSIONS):
+    """Flattens inheritance into one bitmask per role; returns (permission_bits, role_masks).
+
+    Raises ValueError naming every required permission no role grants, e.g. one added to the
+    routes after a custom RBAC_POLICY_FILE was written.
+    """
+    permissions = sorted({p for role in policy.values() for p in role.get("permissions", [])})
+    missing = [permission for permission in required if permission not in permissions]
+    if missing:
+        raise ValueError(f"RBAC policy grants no role the permission(s) {', '.join(missing)}; "
+                         "add them to a role in RBAC_POLICY_FILE")
+    permission_bits = {permission: 1 << i for i, permission in enumerate(permissions)}
+    role_masks: dict = {}
+
+    def mask_for(role: str, visiting: tuple) -> int:
+        if role in role_masks:
+            return role_masks[role]
+        if role not in policy:
+            raise ValueError(f"Unknown role '{role}' in RBAC policy")
+        if role in visiting:
+            raise ValueError(f"Circular inheritance in RBAC policy: {' -> '.join(visiting + (role,))}")
+        mask = 0
+        for permission in policy[role].get("permissions", []):
+            mask |= permission_bits[permission]
+        for parent in policy[role].get("inherits", []):
+            mask |= mask_for(parent, visiting + (role,))
+        role_masks[role] = mask
+        return mask
+
+    for role in policy:
+        mask_for(role, ())
+    return permission_bits, role_masks
+
+
+PERMISSION_BITS, ROLE_MASKS = compile_policy(load_policy())
+
+
+def permission_bit(permission: str) -> int:
+    if permission not in PERMISSION_BITS:
+        raise ValueError(f"Unknown permission '{permission}': not granted to any role in the RBAC policy")
+    return PERMISSION_BITS[permission]
+
+
+def is_known_role(role: str) -> bool:
+    return role in ROLE_MASKS
+
+
+def role_has(role: str, bit: int) -> bool:
+    return bool(ROLE_MASKS.get(role, 0) & bit)
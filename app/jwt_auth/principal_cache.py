@@ -0,0 +1,24 @@
+from typing import NamedTuple
+from dotenv import load_dotenv
+from cache.ttl_lru import TTLLRUCache
+import os
+
+load_dotenv()
+
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+
+
+class Principal(NamedTuple):
+    id: str
+    username: str
+    role: str
+    token_version: int = 0
+
+
+# user_id -> Principal, so authenticated requests skip the User lookup on a warm cache
+principal_cache = TTLLRUCache(maxsize=PRINCIPAL_CACHE_SIZE, ttl=PRINCIPAL_CACHE_TTL)
+
+
+def invalidate_principal(user_id):
+    principal_cache.invalidate(str(user_id))
@@ -0,0 +1,59 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+from model.refresh_token_model import RefreshToken
+from repository.token_repository import refresh_token_repository
+from repository.user_repository import user_repository
+from exceptions.user_exception import InvalidRefreshTokenException, UserNotFoundException
+import os
+
+load_dotenv()
+
+REFRESH_TOKEN_EXPIRE_SECONDS = int(os.getenv("REFRESH_TOKEN_EXPIRE_SECONDS", str(14 * 24 * 3600)))
+
+
+def hash_refresh_token(token: str) -> str:
+    # refresh tokens are 256 random bits, so a fast hash is enough (no bcrypt needed)
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def issue_refresh_token(user, family: str = None) -> str: # type: ignore
+    token = secrets.token_urlsafe(32)
+    await refresh_token_repository.insert(RefreshToken(
+        token_hash=hash_refresh_token(token),
+        user_id=user.id,
+        family=family or uuid.uuid4().hex,
+        token_version=user.token_version or 0,
+        expires_at=datetime.utcnow() + timedelta(seconds=REFRESH_TOKEN_EXPIRE_SECONDS),
+    ))
+    return token
+
+
+async def rotate_refresh_token(token: str):
+    """Consumes a refresh token and returns (user, replacement token).
+
+    Presenting an already-used token means it leaked, so its whole family is revoked;
+    so is a token issued before the user's last revoke_tokens().
+    """
+    token_hash = hash_refresh_token(token)
+    consumed = await refresh_token_repository.consume(token_hash)
+    if consumed is None:
+        stale = await refresh_token_repository.find_by_hash(token_hash)
+        if stale is not None and stale.revoked:
+            await refresh_token_repository.revoke_family(stale.family)
+        raise InvalidRefreshTokenException()
+    user = await user_repository.get_by_id(consumed.user_id)
+    if user is None:
+        raise UserNotFoundException()
+    if (consumed.token_version or 0) < (user.token_version or 0):
+        await refresh_token_repository.revoke_family(consumed.family)
+        raise InvalidRefreshTokenException()
+    return user, await issue_refresh_token(user, consumed.family)
+
+
+async def revoke_refresh_token(token: str):
+    stale = await refresh_token_repository.find_by_hash(hash_refresh_token(token))
+    if stale is not None:
+        await refresh_token_repository.revoke_family(stale.family)
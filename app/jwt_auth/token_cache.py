@@ -0,0 +1,27 @@
+import hashlib
+import time
+from typing import Optional
+from dotenv import load_dotenv
+from cache.ttl_lru import TTLLRUCache
+import os
+
+load_dotenv()
+
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "50000"))
+
+# sha256(token) -> decoded payload; entries expire with the token itself
+verified_token_cache = TTLLRUCache(maxsize=TOKEN_CACHE_SIZE)
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def token_expiry(payload: dict) -> Optional[float]:
+    return payload.get("exp") or payload.get("expires")
+
+
+def cache_verified_token(key: bytes, payload: dict):
+    expires = token_expiry(payload)
+    if expires:
+        verified_token_cache.set(key, payload, ttl=expires - time.time())
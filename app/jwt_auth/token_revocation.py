@@ -0,0 +1,46 @@
+import threading
+
+# user_id -> (lowest token_version still accepted, epoch seconds it was bumped).
+# Filled by User saves in this process and by the periodic sync from the user collection, so
+# revoke_tokens() in any worker takes effect here without a DB read per request.
+_min_token_versions: dict = {}
+_lock = threading.Lock()
+
+
+def note_token_version(user_id, token_version: int, revoked_at: float):
+    with _lock:
+        current = _min_token_versions.get(str(user_id))
+        if current is None or current[0] <= token_version:
+            _min_token_versions[str(user_id)] = (token_version, revoked_at)
+
+
+def is_token_version_revoked(user_id, token_version) -> bool:
+    entry = _min_token_versions.get(str(user_id))
+    return entry is not None and (token_version or 0) < entry[0]
+
+
+# jti -> exp (epoch seconds) of revoked access tokens. Filled by logout in this process and
+# by the periodic sync from the revoked_token collection, so checks never hit Mongo.
+_revoked_jtis: dict = {}
+
+
+def revoke_jti(jti: str, expires: float):
+    with _lock:
+        _revoked_jtis[jti] = expires
+
+
+def is_jti_revoked(jti) -> bool:
+    return jti is not None and jti in _revoked_jtis
+
+
+def prune_revocations(now: float, token_lifetime: float):
+    """Drops revoked jtis past their exp, and version bumps older than any token they could reject."""
+    with _lock:
+        for jti in [jti for jti, expires in _revoked_jtis.items() if expires <= now]:
+            del _revoked_jtis[jti]
+        for user_id in [user_id for user_id, (_, revoked_at) in _min_token_versions.items() if revoked_at + token_lifetime <= now]:
+            del _min_token_versions[user_id]
+
+
+def revoked_jti_count() -> int:
+    return len(_revoked_jtis)
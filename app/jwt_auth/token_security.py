@@ -1,23 +1,50 @@
 import time
+import uuid
 import jwt
 from dotenv import load_dotenv
 import os
 from fastapi.responses import JSONResponse
+from jwt_auth.keyring import load_keyring
+from metrics.registry import timed
 load_dotenv()
 JWT_SECRET = str(os.getenv("secret"))
 JWT_ALGORITHM = str(os.getenv("algorithm"))
 
-def sign_jwt(user_id: str):
+# falls back to a single HMAC key built from secret/algorithm when JWT_KEYS_FILE is unset
+keyring = load_keyring(JWT_SECRET, JWT_ALGORITHM)
+ACCESS_TOKEN_EXPIRE_SECONDS = int(os.getenv("ACCESS_TOKEN_EXPIRE_SECONDS", "600"))
+
+# v1 tokens carried only user_id and a custom "expires"; v2 tokens are self-contained
+TOKEN_FORMAT_VERSION = 2
+
+def sign_jwt(user_id: str, username: str = None, role: str = None, token_version: int = 0): # type: ignore
+    now = int(time.time())
     payload={
-        "user_id":user_id,
-        "expires":time.time()+600
+        "sub":user_id,
+        "username":username,
+        "role":role,
+        "iat":now,
+        "exp":now+ACCESS_TOKEN_EXPIRE_SECONDS,
+        "jti":uuid.uuid4().hex,
+        "ver":TOKEN_FORMAT_VERSION,
+        "tv":token_version
     }
-    token=jwt.encode(payload,JWT_SECRET,algorithm=JWT_ALGORITHM)
+    token=keyring.sign(payload)
     return str(token)
 
+def sign_user_jwt(user):
+    return sign_jwt(str(user.id), username=user.username, role=user.role, token_version=user.token_version or 0)
+
+@timed("jwt_decode")
 def decode_jwt(token:str):
     try:
-        decoded_token=jwt.decode(token,JWT_SECRET,algorithms=[JWT_ALGORITHM])
+        decoded_token=keyring.decode(token)
+        if "sub" not in decoded_token:
+            # v1 token: PyJWT does not know about the custom expiry field
+            if decoded_token.get("expires", 0) < time.time():
+                return None
+            decoded_token["sub"] = decoded_token.get("user_id")
+            decoded_token["ver"] = 1
         return decoded_token
     except jwt.ExpiredSignatureError:
         return None
@@ -2,10 +2,21 @@ from typing import Optional
 from fastapi import Request, HTTPException
 from fastapi.security import HTTPBearer
 from jwt_auth.token_security import decode_jwt
+from jwt_auth.token_revocation import is_token_version_revoked, is_jti_revoked
+from jwt_auth.token_cache import verified_token_cache, token_digest, cache_verified_token
+from settings import _bool
+
+# When enabled, v2 tokens are authorized from their signed role/username claims alone
+CLAIMS_AUTHORIZATION = _bool("JWT_CLAIMS_AUTHORIZATION", "true")
+
+def token_revoked() -> HTTPException:
+    # one response for a logged-out jti and a bumped token_version, whichever path caught it
+    return HTTPException(status_code=403, detail="Token has been revoked")
 
 class JWTBearer(HTTPBearer):
-    def __init__(self, auto_error: bool = True):
+    def __init__(self, auto_error: bool = True, claims_authorization: bool = CLAIMS_AUTHORIZATION):
         super(JWTBearer, self).__init__(auto_error=auto_error)
+        self.claims_authorization = claims_authorization
 
     async def __call__(self, request: Request) -> Optional[dict]:
         credentials = await super(JWTBearer, self).__call__(request)
@@ -13,9 +24,26 @@ class JWTBearer(HTTPBearer):
             token_payload = self.verify_jwt(credentials.credentials)
             if not token_payload:
                 raise HTTPException(status_code=403, detail="Invalid or expired token")
+            if is_jti_revoked(token_payload.get("jti")):
+                raise token_revoked()
+            if self.claims_authorization and has_authorization_claims(token_payload):
+                if is_token_version_revoked(token_payload["sub"], token_payload.get("tv")):
+                    raise token_revoked()
+                return dict(token_payload, authz="claims")
             return token_payload
         raise HTTPException(status_code=403, detail="Invalid authorization code")
 
     def verify_jwt(self, token: str) -> Optional[dict]:
+        # cached payloads are shared between requests and must be treated as read-only
+        key = token_digest(token)
+        payload = verified_token_cache.get(key)
+        if payload is not None:
+            return payload
         payload = decode_jwt(token)
-        return payload if payload else None # type: ignore
\ No newline at end of file
+        if not payload:
+            return None
+        cache_verified_token(key, payload)
+        return payload
+
+def has_authorization_claims(token_payload: dict) -> bool:
+    return token_payload.get("ver", 1) >= 2 and bool(token_payload.get("role")) and bool(token_payload.get("username"))
@@ -1,19 +1,146 @@
-from fastapi import FastAPI
+import time
+_import_started = time.perf_counter()
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.responses import RedirectResponse
-from routes import user_routes,project_routes  # type: ignore
-from db import init_db
+from metrics.startup import startup_report
+from db import connect_db, close_db, check_db, ping_db
+from settings import settings
+startup_report.record("import", time.perf_counter() - _import_started)
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
 
-app.include_router(user_routes.router)
-app.include_router(project_routes.router)
-init_db()
+root_router = APIRouter()
 
-@app.get('/',tags=['root'])
+async def with_retries(step, deadline: float, what: str, fatal: tuple = ()):
+  """Awaits step() until it succeeds, backing off exponentially; re-raises once deadline seconds have passed.
+
+  Exceptions in fatal are re-raised at once, since waiting cannot fix them.
+  """
+  started = time.monotonic()
+  delay = 0.5
+  while True:
+    try:
+      return await step()
+    except fatal:
+      raise
+    except Exception:
+      if time.monotonic() - started + delay > deadline:
+        raise
+      logger.warning("%s failed, retrying in %.1fs", what, delay, exc_info=True)
+      await asyncio.sleep(delay)
+      delay = min(delay * 2, 5.0)
+
+async def prepare_database(app: FastAPI):
+  """Runs before the worker serves: the unique indexes are the only duplicate guard on writes,
+  and revoked tokens must be known before any request is authorized."""
+  from repository.indexes import sync_indexes, UniqueIndexMissing
+  from services.revocation_sync import sync_revoked_tokens, revocation_sync_loop
+  deadline = app.state.settings.startup_db_timeout
+  with startup_report.phase("database"):
+    await with_retries(check_db, deadline, "MongoDB ping")
+    try:
+      await with_retries(lambda: sync_indexes(require_unique=True), deadline, "Index sync", fatal=(UniqueIndexMissing,))
+    except UniqueIndexMissing:
+      # stored duplicates or AUTO_CREATE_INDEXES=false; fix with python -m repository.indexes
+      logger.critical("Refusing to serve without the unique indexes", exc_info=True)
+      raise
+    await with_retries(sync_revoked_tokens, deadline, "Revoked token sync")
+  app.state.revocation_sync = asyncio.create_task(revocation_sync_loop())
+
+async def warmup(app: FastAPI):
+  """Work that may finish after the worker starts serving; /ready is 503 until it ends."""
+  from services.hash_pool import hash_pool
+  from model.user_model import get_pwd_context
+  with startup_report.phase("warmup"):
+    # loads passlib and the bcrypt backend now rather than on the first login
+    await hash_pool.run(lambda: get_pwd_context().handler("bcrypt").get_backend())
+  startup_report.ready = True
+  startup_report.log()
+
+async def background_warmup(app: FastAPI):
+  try:
+    await warmup(app)
+  except Exception:
+    logger.exception("Startup warmup failed; /ready stays unavailable")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  from services.hash_pool import hash_pool
+  settings = app.state.settings
+  app.state.revocation_sync = None
+  app.state.warmup = None
+  # the client is created here, inside each worker; it opens sockets lazily
+  with startup_report.phase("connect"):
+    await connect_db(settings)
+  try:
+    await prepare_database(app)
+  except Exception:
+    close_db()
+    raise
+  if settings.startup_warmup == "blocking":
+    await warmup(app)
+  else:
+    app.state.warmup = asyncio.create_task(background_warmup(app))
+  yield
+  for task in (app.state.warmup, app.state.revocation_sync):
+    if task is not None:
+      task.cancel()
+  hash_pool.shutdown()
+  close_db()
+
+def create_app(settings=settings) -> FastAPI:
+  """Builds the app; settings only reaches the MongoDB connection, readiness and startup code.
+
+  Everything else (JWT keys, rate limits, caches, RBAC policy, metrics) is read from the
+  environment by its own module when first imported, so it is fixed per process rather than
+  per app. The module-level app below makes the route imports eager; they sit in here so the
+  "import" startup phase measures them.
+  """
+  with startup_report.phase("import"):
+    from routes import user_routes,project_routes,project_bulk_routes,project_export_routes,token_routes,diagnostics_routes  # type: ignore
+    from metrics.mongo_monitor import install_mongo_monitoring
+    from metrics.middleware import MetricsMiddleware
+    from metrics.registry import METRICS_ENABLED
+    from metrics.collectors import register_collectors
+    from exceptions.handlers import register_exception_handlers
+
+  with startup_report.phase("build"):
+    install_mongo_monitoring()
+    register_collectors()
+
+    app = FastAPI(lifespan=lifespan)
+    app.state.settings = settings
+    if METRICS_ENABLED:
+      app.add_middleware(MetricsMiddleware)
+    register_exception_handlers(app)
+
+    app.include_router(root_router)
+    app.include_router(user_routes.router)
+    app.include_router(project_routes.router)
+    app.include_router(project_bulk_routes.router)
+    app.include_router(project_export_routes.router)
+    app.include_router(token_routes.router)
+    app.include_router(diagnostics_routes.router)
+  return app
+
+@root_router.get('/',tags=['root'])
 def root():
   # return RedirectResponse(url='/docs')
   return JSONResponse(
         content={'message': 'Welcome to the Library Management System APIs'},
         status_code=200
     )
+
+@root_router.get('/ready',tags=['root'])
+async def ready(request: Request):
+  if not startup_report.ready:
+    return JSONResponse(content={'status': 'starting'}, status_code=503)
+  if await ping_db(request.app.state.settings.readiness_timeout):
+    return JSONResponse(content={'status': 'ready'}, status_code=200)
+  return JSONResponse(content={'status': 'unavailable', 'detail': 'MongoDB did not answer ping'}, status_code=503)
+
+app = create_app()
@@ -0,0 +1,32 @@
+from metrics.registry import Gauge, COLLECTORS
+from jwt_auth.principal_cache import principal_cache
+from jwt_auth.token_cache import verified_token_cache
+from jwt_auth.token_revocation import revoked_jti_count
+from services.hash_pool import hash_pool
+from services.rate_limiter import rate_limiter
+from services.response_cache import project_list_cache
+
+cache_hits = Gauge("app_cache_hits", "Cache hits since start", ("cache",))
+cache_misses = Gauge("app_cache_misses", "Cache misses since start", ("cache",))
+cache_size = Gauge("app_cache_entries", "Entries currently cached", ("cache",))
+hash_pool_rejected = Gauge("app_hash_pool_rejected", "Hashing requests shed with 503 since start")
+rate_limited = Gauge("app_rate_limited", "Requests rejected with 429 since start")
+revoked_jtis = Gauge("app_revoked_jtis", "Revoked access-token ids held in memory")
+
+CACHES = {"principal": principal_cache, "verified_token": verified_token_cache, "project_list": project_list_cache}
+
+
+def collect():
+    for name, cache in CACHES.items():
+        stats = cache.stats()
+        cache_hits.set((name,), stats["hits"])
+        cache_misses.set((name,), stats["misses"])
+        cache_size.set((name,), stats["size"])
+    hash_pool_rejected.set((), hash_pool.rejected)
+    rate_limited.set((), rate_limiter.rejected)
+    revoked_jtis.set((), revoked_jti_count())
+
+
+def register_collectors():
+    if collect not in COLLECTORS:
+        COLLECTORS.append(collect)
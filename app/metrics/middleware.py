@@ -0,0 +1,58 @@
+import time
+from contextvars import ContextVar
+from metrics.registry import Counter, Gauge, Histogram
+
+request_seconds = Histogram("http_request_duration_seconds", "HTTP request latency by route template", ("method", "route"))
+requests_total = Counter("http_requests_total", "HTTP responses by route template and status", ("method", "route", "status"))
+requests_in_flight = Gauge("http_requests_in_flight", "Requests currently being handled")
+mongo_queries_per_request = Histogram(
+    "mongo_commands_per_request", "Mongo commands issued while handling one request", ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+)
+
+
+class RequestStats:
+    __slots__ = ("mongo_commands", "mongo_seconds")
+
+    def __init__(self):
+        self.mongo_commands = 0
+        self.mongo_seconds = 0.0
+
+
+# set per request so the Mongo command listener can attribute work to it
+current_request_stats: ContextVar = ContextVar("current_request_stats", default=None)
+
+
+class MetricsMiddleware:
+    """Plain ASGI middleware (no BaseHTTPMiddleware) so the per-request cost is a few dict updates."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status_holder = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            requests_in_flight.dec()
+            current_request_stats.reset(token)
+            # route template, not the raw path, keeps label cardinality bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            request_seconds.observe((method, route), elapsed)
+            requests_total.inc((method, route, str(status_holder[0])))
+            mongo_queries_per_request.observe((route,), stats.mongo_commands)
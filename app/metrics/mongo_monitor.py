@@ -0,0 +1,133 @@
+import threading
+from pymongo import monitoring
+from metrics.registry import Counter, Gauge, Histogram, METRICS_ENABLED
+from metrics.middleware import current_request_stats
+
+mongo_command_seconds = Histogram("mongo_command_duration_seconds", "Mongo command round-trip time", ("command",))
+mongo_command_failures = Counter("mongo_command_failures_total", "Mongo commands that failed", ("command",))
+mongo_pool_checked_out = Gauge("mongo_pool_checked_out", "Pooled connections currently checked out", ("address",))
+mongo_pool_connections = Gauge("mongo_pool_connections", "Open pooled connections", ("address",))
+mongo_pool_wait_seconds = Histogram("mongo_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection", ("address",))
+mongo_pool_checkout_failures = Counter("mongo_pool_checkout_failures_total", "Connection checkouts that failed", ("address", "reason"))
+mongo_pool_cleared = Counter("mongo_pool_cleared_total", "Times a pool was cleared after a network error", ("address",))
+
+
+class CommandTimingListener(monitoring.CommandListener):
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event)
+
+    def failed(self, event):
+        mongo_command_failures.inc((event.command_name,))
+        self._record(event)
+
+    def _record(self, event):
+        seconds = event.duration_micros / 1e6
+        mongo_command_seconds.observe((event.command_name,), seconds)
+        # only attributed when the driver runs the command in the request's context
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.mongo_commands += 1
+            stats.mongo_seconds += seconds
+
+
+def _address(event) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """CMAP events -> per-server pool stats; pymongo calls these from its own threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers: dict = {}
+
+    def _stats(self, event) -> dict:
+        address = _address(event)
+        stats = self._servers.get(address)
+        if stats is None:
+            stats = self._servers[address] = {
+                "checked_out": 0, "connections": 0, "checkouts": 0, "checkout_failures": {},
+                "wait_seconds_total": 0.0, "max_wait_seconds": 0.0, "cleared": 0,
+            }
+        return stats
+
+    def pool_created(self, event):
+        with self._lock:
+            self._stats(event)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        mongo_pool_cleared.inc((_address(event),))
+        with self._lock:
+            self._stats(event)["cleared"] += 1
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._servers.pop(_address(event), None)
+        mongo_pool_checked_out.set((_address(event),), 0)
+        mongo_pool_connections.set((_address(event),), 0)
+
+    def connection_created(self, event):
+        mongo_pool_connections.inc((_address(event),))
+        with self._lock:
+            self._stats(event)["connections"] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        mongo_pool_connections.dec((_address(event),))
+        with self._lock:
+            self._stats(event)["connections"] -= 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        # reason is "timeout" when waitQueueTimeoutMS expired with every connection in use
+        mongo_pool_checkout_failures.inc((_address(event), event.reason))
+        with self._lock:
+            failures = self._stats(event)["checkout_failures"]
+            failures[event.reason] = failures.get(event.reason, 0) + 1
+
+    def connection_checked_out(self, event):
+        address = _address(event)
+        mongo_pool_wait_seconds.observe((address,), event.duration)
+        mongo_pool_checked_out.inc((address,))
+        with self._lock:
+            stats = self._stats(event)
+            stats["checked_out"] += 1
+            stats["checkouts"] += 1
+            stats["wait_seconds_total"] += event.duration
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], event.duration)
+
+    def connection_checked_in(self, event):
+        mongo_pool_checked_out.dec((_address(event),))
+        with self._lock:
+            self._stats(event)["checked_out"] -= 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {address: dict(stats, checkout_failures=dict(stats["checkout_failures"]))
+                    for address, stats in self._servers.items()}
+
+
+pool_stats = PoolStatsListener()
+
+_installed = False
+
+
+def install_mongo_monitoring():
+    """Must run before the first MongoClient / Motor client is created."""
+    global _installed
+    if not _installed:
+        if METRICS_ENABLED:
+            monitoring.register(CommandTimingListener())
+        monitoring.register(pool_stats)
+        _installed = True
@@ -0,0 +1,42 @@
+import logging
+import time
+from contextlib import contextmanager
+from metrics.registry import Gauge
+
+logger = logging.getLogger(__name__)
+
+startup_phase_seconds = Gauge("app_startup_phase_seconds", "Duration of each worker startup phase", ("phase",))
+
+
+class StartupReport:
+    """Wall-clock time of the startup phases (import, build, connect, database, warmup) of this worker."""
+
+    def __init__(self):
+        self.phases: dict = {}
+        self.ready = False
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        startup_phase_seconds.set((name,), self.phases[name])
+
+    def summary(self) -> dict:
+        return {
+            "ready": self.ready,
+            "phases_ms": {name: round(seconds * 1000, 1) for name, seconds in self.phases.items()},
+            "total_ms": round(sum(self.phases.values()) * 1000, 1),
+        }
+
+    def log(self):
+        parts = ", ".join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in self.phases.items())
+        logger.info("Worker started in %.1fms (%s)", sum(self.phases.values()) * 1000, parts)
+
+
+startup_report = StartupReport()
@@ -1,12 +1,29 @@
 from mongoengine import Document
-from mongoengine.fields import StringField,DateTimeField
+from mongoengine.fields import StringField,DateTimeField,ObjectIdField
 from datetime import datetime
 class Project(Document):
   name = StringField(required=True)
   description = StringField(required=True)
   created_by= StringField(required=True)
+  # id of the creating user; created_by keeps the username for existing clients
+  owner_id=ObjectIdField()
   created_at=DateTimeField(default=datetime.utcnow)
+  # refreshed on every write; the watermark for incremental exports
+  updated_at=DateTimeField(default=datetime.utcnow)
 
-
-
-
+  meta = {
+    "indexes": [
+      # duplicate names are rejected by this index rather than a lookup before insert
+      {"fields": ["name"], "unique": True},
+      # backs keyset pagination on /getprojects
+      {"fields": ["created_at", "id"]},
+      # backs /searchprojects?created_by=... ordered by created_at; its prefix serves created_by alone
+      {"fields": ["created_by", "created_at", "id"]},
+      # backs /searchprojects?q=...; name matches weigh more than description matches
+      {"fields": ["$name", "$description"], "weights": {"name": 10, "description": 2}, "name": "project_text"},
+      # backs /myprojects (keyset within one owner) and owner checks
+      {"fields": ["owner_id", "created_at", "id"]},
+      # backs /exportprojects?since=...&watermark=updated_at
+      {"fields": ["updated_at", "id"]},
+    ]
+  }
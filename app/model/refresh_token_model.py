@@ -0,0 +1,23 @@
+from mongoengine import Document
+from mongoengine.fields import StringField,DateTimeField,BooleanField,ObjectIdField,IntField
+from datetime import datetime
+
+class RefreshToken(Document):
+    # only the sha256 of the token is stored; the token itself is shown to the client once
+    token_hash = StringField(required=True)
+    user_id = ObjectIdField(required=True)
+    # every token rotated from the same login shares a family, so reuse can revoke the chain
+    family = StringField(required=True)
+    # the user's token_version at issue; a later revoke_tokens() makes the token unusable
+    token_version = IntField(default=0)
+    expires_at = DateTimeField(required=True)
+    revoked = BooleanField(default=False)
+    created_at = DateTimeField(default=datetime.utcnow)
+
+    meta = {
+        "indexes": [
+            {"fields": ["token_hash"], "unique": True},
+            {"fields": ["family"]},
+            {"fields": ["expires_at"], "expireAfterSeconds": 0},
+        ]
+    }
@@ -0,0 +1,17 @@
+from mongoengine import Document
+from mongoengine.fields import StringField,DateTimeField
+from datetime import datetime
+
+class RevokedToken(Document):
+    jti = StringField(required=True)
+    # the access token's own exp; past it the entry is useless and Mongo drops it
+    expires_at = DateTimeField(required=True)
+    revoked_at = DateTimeField(default=datetime.utcnow)
+
+    meta = {
+        "indexes": [
+            {"fields": ["jti"], "unique": True},
+            {"fields": ["revoked_at"]},
+            {"fields": ["expires_at"], "expireAfterSeconds": 0},
+        ]
+    }
@@ -1,16 +1,85 @@
 from mongoengine import Document
-from mongoengine.fields import StringField
-from passlib.context import CryptContext
+from mongoengine.fields import StringField,IntField,DateTimeField
+from datetime import datetime, timezone
+from jwt_auth.principal_cache import invalidate_principal
+from jwt_auth.token_revocation import note_token_version
+from metrics.registry import timed
+from dotenv import load_dotenv
+import os
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+load_dotenv()
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+_pwd_context = None
+
+def get_pwd_context():
+    """Built on first use, so importing the model does not load passlib and its bcrypt backend."""
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        # min == max == default so hashes made with any other cost are flagged for rehash on login
+        _pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=BCRYPT_ROUNDS,
+            bcrypt__min_rounds=BCRYPT_ROUNDS,
+            bcrypt__max_rounds=BCRYPT_ROUNDS,
+        )
+    return _pwd_context
 
 class User(Document):
     username = StringField(required=True)
     password = StringField(required=True)
     role= StringField(default="user")
+    # bumped to revoke every token issued before it
+    token_version = IntField(default=0)
+    # when token_version was last bumped; other workers poll for recent bumps
+    tokens_revoked_at = DateTimeField()
 
+    meta = {
+        "indexes": [
+            {"fields": ["username"], "unique": True},
+            {"fields": ["tokens_revoked_at"], "sparse": True},
+        ]
+    }
+
+    @timed("password_hash")
     def set_password(self, password: str):
-        self.password = pwd_context.hash(password)
+        self.password = get_pwd_context().hash(password)
 
     def verify_password(self, password: str):
-        return pwd_context.verify(password, str(self.password))
+        return get_pwd_context().verify(password, str(self.password))
+
+    @timed("password_verify")
+    def verify_and_update_password(self, password: str):
+        is_valid, new_hash = get_pwd_context().verify_and_update(password, str(self.password))
+        if is_valid and new_hash:
+            self.password = new_hash
+        return is_valid, bool(is_valid and new_hash)
+
+    def revoke_tokens(self):
+        # persisted by the caller via save() or user_repository.update()
+        self.token_version = (self.token_version or 0) + 1
+        self.tokens_revoked_at = datetime.utcnow()
+
+    def save(self, *args, **kwargs):
+        changed_fields = self._get_changed_fields() # type: ignore
+        user = super().save(*args, **kwargs)
+        self.after_save(changed_fields)
+        return user
+
+    def delete(self, *args, **kwargs):
+        super().delete(*args, **kwargs)
+        self.after_delete()
+
+    def after_save(self, changed_fields):
+        # cached principals hold the role, so drop them when credentials change
+        if "token_version" in changed_fields:
+            revoked_at = self.tokens_revoked_at.replace(tzinfo=timezone.utc).timestamp() # type: ignore
+            note_token_version(self.id, self.token_version, revoked_at) # type: ignore
+        if {"role", "password", "token_version"} & set(changed_fields):
+            invalidate_principal(self.id) # type: ignore
+
+    def after_delete(self):
+        invalidate_principal(self.id) # type: ignore
@@ -0,0 +1,89 @@
+from typing import Optional
+from bson import ObjectId
+from db import get_database, list_read_preference
+
+
+def to_object_id(id) -> Optional[ObjectId]:
+    if isinstance(id, ObjectId):
+        return id
+    return ObjectId(id) if ObjectId.is_valid(id) else None
+
+
+class BaseRepository:
+    """Async persistence for a mongoengine Document.
+
+    The Document class still defines fields, defaults, validation and indexes;
+    the repository only swaps mongoengine's blocking queryset for Motor calls.
+    """
+
+    document = None
+
+    def __init__(self, database=None):
+        self._database = database
+
+    @property
+    def collection(self):
+        database = self._database if self._database is not None else get_database()
+        return database[self.document._get_collection_name()] # type: ignore
+
+    @property
+    def read_collection(self):
+        """collection for list/count reads, routed by MONGO_LIST_READ_PREFERENCE (e.g. to secondaries)."""
+        preference = list_read_preference()
+        return self.collection if preference is None else self.collection.with_options(read_preference=preference)
+
+    def to_document(self, son):
+        return None if son is None else self.document._from_son(son) # type: ignore
+
+    async def find_one(self, query: dict):
+        return self.to_document(await self.collection.find_one(query))
+
+    async def get_by_id(self, id):
+        object_id = to_object_id(id)
+        if object_id is None:
+            return None
+        return await self.find_one({"_id": object_id})
+
+    async def insert(self, doc):
+        doc.validate()
+        son = doc.to_mongo().to_dict()
+        result = await self.collection.insert_one(son)
+        doc.id = result.inserted_id
+        doc._clear_changed_fields()
+        self.after_insert(doc)
+        return doc
+
+    async def update(self, doc):
+        # same $set/$unset delta mongoengine's Document.save() would send
+        doc.validate()
+        changed_fields = doc._get_changed_fields()
+        set_data, unset_data = doc._delta()
+        update = {}
+        if set_data:
+            update["$set"] = set_data
+        if unset_data:
+            update["$unset"] = unset_data
+        if update:
+            await self.collection.update_one({"_id": doc.pk}, update)
+        doc._clear_changed_fields()
+        self.after_update(doc, changed_fields)
+        return doc
+
+    async def delete(self, doc):
+        await self.collection.delete_one({"_id": doc.pk})
+        self.after_delete(doc)
+
+    async def ensure_indexes(self):
+        for spec in self.document._meta.get("index_specs") or []: # type: ignore
+            spec = dict(spec)
+            fields = spec.pop("fields")
+            await self.collection.create_index(fields, **spec)
+
+    def after_insert(self, doc):
+        pass
+
+    def after_update(self, doc, changed_fields):
+        pass
+
+    def after_delete(self, doc):
+        pass
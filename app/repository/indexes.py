@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import logging
+from pymongo.errors import OperationFailure
+from repository.user_repository import user_repository
+from repository.project_repository import project_repository
+from repository.token_repository import refresh_token_repository, revoked_token_repository
+from settings import _bool
+
+logger = logging.getLogger(__name__)
+
+AUTO_CREATE_INDEXES = _bool("AUTO_CREATE_INDEXES", "true")
+
+REPOSITORIES = [user_repository, project_repository, refresh_token_repository, revoked_token_repository]
+
+
+def _index_key(fields, weights=None) -> tuple:
+    key = tuple((name, int(direction)) if isinstance(direction, (int, float)) else (name, direction) for name, direction in fields)
+    # the server reports a text index as _fts/_ftsx plus its weights, so compare text fields as a set
+    text = sorted((name, "text") for name in weights) if weights else sorted(f for f in key if f[1] == "text")
+    if not text:
+        return key
+    return tuple(f for f in key if f[1] != "text" and f[0] not in ("_fts", "_ftsx")) + tuple(text)
+
+
+class UniqueIndexMissing(RuntimeError):
+    """A unique index the routes rely on to reject duplicates is absent or could not be built."""
+
+
+async def sync_indexes(create: bool = AUTO_CREATE_INDEXES, require_unique: bool = False) -> dict:
+    """Compare each Document's meta indexes with the live collection.
+
+    Returns {collection: {"present": [...], "created": [...], "missing": [...], "failed": [...]}}.
+    With create=False nothing is changed and absent indexes are only reported as missing.
+    With require_unique, UniqueIndexMissing is raised if any unique index ends up missing or failed.
+    """
+    report = {}
+    unique_problems = []
+    for repository in REPOSITORIES:
+        collection = repository.collection
+        existing = await collection.index_information()
+        existing_keys = {_index_key(info["key"], info.get("weights")): bool(info.get("unique")) for info in existing.values()}
+        result = {"present": [], "created": [], "missing": [], "failed": []}
+        for spec in repository.document._meta.get("index_specs") or []:
+            spec = dict(spec)
+            fields = spec.pop("fields")
+            key = _index_key(fields)
+            label = ",".join(f"{name}:{direction}" for name, direction in key) + (" unique" if spec.get("unique") else "")
+            if existing_keys.get(key) == bool(spec.get("unique")):
+                result["present"].append(label)
+            elif not create:
+                result["missing"].append(label)
+                if spec.get("unique"):
+                    unique_problems.append(f"{collection.name} {label}: missing")
+            else:
+                try:
+                    await collection.create_index(fields, **spec)
+                    result["created"].append(label)
+                except OperationFailure as e:
+                    # e.g. duplicates already stored under a new unique index
+                    result["failed"].append(f"{label}: {e}")
+                    if spec.get("unique"):
+                        unique_problems.append(f"{collection.name} {label}: {e}")
+        report[collection.name] = result
+        for state in ("missing", "failed"):
+            for label in result[state]:
+                logger.warning("Index %s on %s: %s", state, collection.name, label)
+    if require_unique and unique_problems:
+        raise UniqueIndexMissing("Unique indexes not in place, duplicates would be accepted: " + "; ".join(unique_problems))
+    return report
+
+
+async def _run_cli(create: bool) -> dict:
+    from db import connect_db, close_db
+    await connect_db()
+    try:
+        return await sync_indexes(create=create)
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create or verify the indexes declared on the models.")
+    parser.add_argument("--check", action="store_true", help="only report missing indexes, do not create them")
+    args = parser.parse_args()
+    result = asyncio.run(_run_cli(create=not args.check))
+    for collection_name, states in result.items():
+        for state, labels in states.items():
+            for label in labels:
+                print(f"{collection_name:<12} {state:<8} {label}")
+    if any(states["missing"] or states["failed"] for states in result.values()):
+        raise SystemExit(1)
@@ -0,0 +1,43 @@
+import asyncio
+import logging
+from repository.user_repository import user_repository
+from repository.project_repository import project_repository
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_owner_ids() -> dict:
+    """Sets owner_id on projects stored before it existed, resolving created_by usernames to user ids.
+
+    Returns {"updated": <projects>, "unmatched": [usernames without a user]}.
+    """
+    projects = project_repository.collection
+    usernames = await projects.distinct("created_by", {"owner_id": {"$exists": False}})
+    owners = {son["username"]: son["_id"] async for son in
+              user_repository.collection.find({"username": {"$in": usernames}}, {"username": 1})}
+    updated = 0
+    for username, owner_id in owners.items():
+        result = await projects.update_many({"created_by": username, "owner_id": {"$exists": False}},
+                                            {"$set": {"owner_id": owner_id}})
+        updated += result.modified_count
+    unmatched = sorted(set(usernames) - set(owners))
+    for username in unmatched:
+        logger.warning("No user named %s; its projects keep no owner_id", username)
+    return {"updated": updated, "unmatched": unmatched}
+
+
+async def _run_cli() -> dict:
+    from db import connect_db, close_db
+    await connect_db()
+    try:
+        return await backfill_owner_ids()
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    # python -m repository.owner_backfill, run from app/
+    result = asyncio.run(_run_cli())
+    print(f"owner_id set on {result['updated']} projects")
+    for username in result["unmatched"]:
+        print(f"unmatched  {username}")
@@ -0,0 +1,53 @@
+import base64
+import json
+from datetime import datetime
+from bson import ObjectId
+
+# Keyset order shared by the listing queries and the (created_at, _id) index backing them
+KEYSET_SORT = [("created_at", 1), ("_id", 1)]
+
+
+def encode_cursor(created_at: datetime, id) -> str:
+    raw = json.dumps({"c": created_at.isoformat(), "i": str(id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Returns (created_at, ObjectId); raises ValueError for anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(raw["c"]), ObjectId(raw["i"])
+    except Exception as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def keyset_filter(created_at: datetime, id: ObjectId) -> dict:
+    return {"$or": [
+        {"created_at": {"$gt": created_at}},
+        {"created_at": created_at, "_id": {"$gt": id}},
+    ]}
+
+
+# /searchprojects orders: text relevance (descending), name or created_at; _id breaks ties ascending
+SEARCH_ORDERS = ("score", "name", "created_at")
+
+
+def encode_search_cursor(order: str, key, id) -> str:
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    raw = json.dumps({"o": order, "k": key, "i": str(id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str, order: str):
+    """Returns (sort key, ObjectId); raises ValueError if malformed or issued for another order."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if raw["o"] != order:
+            raise ValueError(order)
+        key = datetime.fromisoformat(raw["k"]) if order == "created_at" else raw["k"]
+        return key, ObjectId(raw["i"])
+    except Exception as e:
+        raise ValueError("Invalid pagination cursor for this search") from e
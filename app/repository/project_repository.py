@@ -0,0 +1,186 @@
+import asyncio
+import re
+from datetime import datetime
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from model.project_model import Project
+from repository.base_repository import BaseRepository
+from repository.pagination import KEYSET_SORT, keyset_filter
+from services.project_count import project_counter
+from services.response_cache import project_list_cache
+
+# fields of ProjectDetailResponse; _id is always returned
+LISTING_PROJECTION = {"name": 1, "description": 1, "created_by": 1, "created_at": 1, "updated_at": 1}
+
+# delete_one calls in flight at once for an unordered bulk delete, well under the pool size
+DELETE_CONCURRENCY = 50
+
+
+class ProjectRepository(BaseRepository):
+    document = Project
+
+    async def list_page_rows(self, offset: int, limit: int):
+        # raw projected dicts for the listing fast path, never hydrated into Documents
+        return await self._page(None, offset, limit, LISTING_PROJECTION).to_list(length=limit)
+
+    async def list_after_rows(self, after, limit: int):
+        # after is a decoded (created_at, _id) cursor; None starts from the beginning
+        return await self._page(after, 0, limit, LISTING_PROJECTION).to_list(length=limit)
+
+    async def list_owned_rows(self, owner_id, after, limit: int):
+        # equality on owner_id plus the keyset order walks the (owner_id, created_at, _id) index
+        return await self._page(after, 0, limit, LISTING_PROJECTION, {"owner_id": owner_id}).to_list(length=limit)
+
+    async def count_owned(self, owner_id) -> int:
+        return await self.read_collection.count_documents({"owner_id": owner_id})
+
+    def search_filter(self, text=None, name_prefix=None, created_by=None, created_after=None, created_before=None) -> dict:
+        query = {}
+        if text:
+            query["$text"] = {"$search": text}
+        if name_prefix:
+            # anchored and case-sensitive, so it becomes a range scan on the unique name index
+            query["name"] = {"$regex": "^" + re.escape(name_prefix)}
+        if created_by:
+            query["created_by"] = created_by
+        created_at = {op: value for op, value in (("$gte", created_after), ("$lt", created_before)) if value is not None}
+        if created_at:
+            query["created_at"] = created_at
+        return query
+
+    def search_pipeline(self, query: dict, order: str, after, limit: int) -> list:
+        """Aggregation for one page of search results in `order` (see SEARCH_ORDERS).
+
+        after is a decoded search cursor. Without $text the stages are pushed down to a plain
+        indexed find; with it, $text must open the pipeline and the keyset on the computed score
+        is applied to its matches.
+        """
+        if order == "score":
+            pipeline = [{"$match": query}, {"$addFields": {"score": {"$meta": "textScore"}}}]
+            if after:
+                pipeline.append({"$match": {"$or": [{"score": {"$lt": after[0]}}, {"score": after[0], "_id": {"$gt": after[1]}}]}})
+            return pipeline + [{"$sort": {"score": -1, "_id": 1}}, {"$limit": limit}, {"$project": dict(LISTING_PROJECTION, score=1)}]
+        if after:
+            # the keyset $or is distributed over the filters so each branch stays a bounded index scan
+            key, id = after
+            bounds = query.get(order, {})
+            query = {"$or": [
+                dict(query, **{order: dict(bounds, **{"$gt": key})}),
+                dict(query, **{order: dict(bounds, **{"$eq": key}), "_id": {"$gt": id}}),
+            ]}
+        return [{"$match": query}, {"$sort": {order: 1, "_id": 1}}, {"$limit": limit}, {"$project": LISTING_PROJECTION}]
+
+    async def search_rows(self, query: dict, order: str, after, limit: int):
+        return await self.read_collection.aggregate(self.search_pipeline(query, order, after, limit)).to_list(length=limit)
+
+    async def count_matching(self, query: dict) -> int:
+        return await self.read_collection.count_documents(query)
+
+    def _page(self, after, offset: int, limit: int, projection=None, query=None):
+        query = dict(query or {}, **keyset_filter(*after)) if after else (query or {})
+        cursor = self.read_collection.find(query, projection).sort(KEYSET_SORT)
+        if offset:
+            cursor = cursor.skip(offset)
+        return cursor.limit(limit)
+
+    async def update(self, doc):
+        if doc._get_changed_fields():
+            doc.updated_at = datetime.utcnow()
+        return await super().update(doc)
+
+    async def export_batches(self, since, after_id, watermark: str, batch_size: int):
+        """Yields lists of raw projected rows in (watermark, _id) order, one driver batch at a time.
+
+        Rows start strictly after (since, after_id), so rows sharing the since timestamp are not
+        skipped; without after_id every row at since is excluded.
+        """
+        query = {}
+        if since is not None:
+            query = self._after(watermark, since, after_id)
+            if watermark == "updated_at":
+                # projects written before updated_at existed only have created_at
+                query = {"$or": [query, {"updated_at": {"$exists": False}, **self._after("created_at", since, after_id)}]}
+        cursor = self.read_collection.find(query, LISTING_PROJECTION, batch_size=batch_size).sort([(watermark, 1), ("_id", 1)])
+        batch = []
+        async for row in cursor:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _after(field: str, since, after_id) -> dict:
+        if after_id is None:
+            return {field: {"$gt": since}}
+        return {"$or": [{field: {"$gt": since}}, {field: since, "_id": {"$gt": after_id}}]}
+
+    async def existing_ids(self, ids) -> set:
+        cursor = self.collection.find({"_id": {"$in": list(ids)}}, {"_id": 1})
+        return {son["_id"] async for son in cursor}
+
+    async def insert_many(self, docs, ordered: bool = True) -> dict:
+        """Inserts validated Documents in one round-trip; returns {position: writeError} for rejected rows."""
+        sons = [doc.to_mongo().to_dict() for doc in docs]
+        errors = await self._bulk(self.collection.insert_many(sons, ordered=ordered))
+        for doc, son in zip(docs, sons):
+            doc.id = son.get("_id")
+        return errors
+
+    async def bulk_update(self, updates, ordered: bool = True) -> dict:
+        """updates is a list of (_id, {field: value}) pairs applied with $set."""
+        now = datetime.utcnow()
+        requests = [UpdateOne({"_id": id}, {"$set": dict(fields, updated_at=now)}) for id, fields in updates]
+        return await self._bulk(self.collection.bulk_write(requests, ordered=ordered))
+
+    async def delete_each(self, ids, ordered: bool = True) -> list:
+        """Deletes ids with one delete_one each; returns per id True (deleted), False (not found) or None (not tried).
+
+        A bulk_write only reports a total deleted_count, which cannot say which id lost a race
+        with another delete, so each id gets its own result. Unordered batches run concurrently
+        in chunks; ordered ones stop at the first id that was not found.
+        """
+        outcomes = [None] * len(ids)
+        try:
+            if ordered:
+                for position, id in enumerate(ids):
+                    outcomes[position] = (await self.collection.delete_one({"_id": id})).deleted_count == 1
+                    if not outcomes[position]:
+                        break
+            else:
+                for start in range(0, len(ids), DELETE_CONCURRENCY):
+                    chunk = ids[start:start + DELETE_CONCURRENCY]
+                    results = await asyncio.gather(*(self.collection.delete_one({"_id": id}) for id in chunk))
+                    outcomes[start:start + len(chunk)] = [result.deleted_count == 1 for result in results]
+        finally:
+            project_counter.invalidate()
+            project_list_cache.bump()
+        return outcomes
+
+    async def _bulk(self, operation) -> dict:
+        try:
+            await operation
+            return {}
+        except BulkWriteError as e:
+            return {error["index"]: error for error in e.details.get("writeErrors", [])}
+        finally:
+            project_counter.invalidate()
+            project_list_cache.bump()
+
+    async def count(self, mode: str = "exact"):
+        return await project_counter.count(self.read_collection, mode)
+
+    def after_insert(self, doc):
+        project_counter.invalidate()
+        project_list_cache.bump()
+
+    def after_update(self, doc, changed_fields):
+        project_list_cache.bump()
+
+    def after_delete(self, doc):
+        project_counter.invalidate()
+        project_list_cache.bump()
+
+
+project_repository = ProjectRepository()
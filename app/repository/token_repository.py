@@ -0,0 +1,46 @@
+from datetime import datetime
+from pymongo import ReturnDocument
+from model.refresh_token_model import RefreshToken
+from model.revoked_token_model import RevokedToken
+from repository.base_repository import BaseRepository
+
+
+class RefreshTokenRepository(BaseRepository):
+    document = RefreshToken
+
+    async def find_by_hash(self, token_hash: str):
+        return await self.find_one({"token_hash": token_hash})
+
+    async def consume(self, token_hash: str):
+        """Atomically marks a live token as used so concurrent refreshes cannot both succeed."""
+        son = await self.collection.find_one_and_update(
+            {"token_hash": token_hash, "revoked": False, "expires_at": {"$gt": datetime.utcnow()}},
+            {"$set": {"revoked": True}},
+            return_document=ReturnDocument.AFTER,
+        )
+        return self.to_document(son)
+
+    async def revoke_family(self, family: str):
+        await self.collection.update_many({"family": family}, {"$set": {"revoked": True}})
+
+
+class RevokedTokenRepository(BaseRepository):
+    document = RevokedToken
+
+    async def add(self, jti: str, expires_at: datetime):
+        await self.collection.update_one(
+            {"jti": jti},
+            {"$setOnInsert": {"jti": jti, "expires_at": expires_at, "revoked_at": datetime.utcnow()}},
+            upsert=True,
+        )
+
+    async def revoked_since(self, since):
+        query = {"expires_at": {"$gt": datetime.utcnow()}}
+        if since is not None:
+            query["revoked_at"] = {"$gte": since}
+        cursor = self.collection.find(query, {"_id": 0, "jti": 1, "expires_at": 1, "revoked_at": 1})
+        return [son async for son in cursor]
+
+
+refresh_token_repository = RefreshTokenRepository()
+revoked_token_repository = RevokedTokenRepository()
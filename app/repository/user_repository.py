@@ -0,0 +1,23 @@
+from model.user_model import User
+from repository.base_repository import BaseRepository
+
+
+class UserRepository(BaseRepository):
+    document = User
+
+    async def find_by_username(self, username: str):
+        return await self.find_one({"username": username})
+
+    async def tokens_revoked_since(self, since):
+        query = {"tokens_revoked_at": {"$gte": since}}
+        cursor = self.collection.find(query, {"token_version": 1, "tokens_revoked_at": 1})
+        return [son async for son in cursor]
+
+    def after_update(self, doc, changed_fields):
+        doc.after_save(changed_fields)
+
+    def after_delete(self, doc):
+        doc.after_delete()
+
+
+user_repository = UserRepository()
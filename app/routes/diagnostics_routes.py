@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+from jwt_auth.authorization import require
+from metrics.registry import render_metrics
+from metrics.startup import startup_report
+from metrics.mongo_monitor import pool_stats
+from db import client_options
+
+# pool sizes, client options and per-route latencies are operational detail, not public
+router = APIRouter(dependencies=[Depends(require("diagnostics:read"))])
+
+@router.get('/metrics',tags=['root'],include_in_schema=False)
+def metrics():
+  return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+@router.get('/diagnostics/mongo',tags=['root'],include_in_schema=False)
+def mongo_diagnostics(request: Request):
+  settings = request.app.state.settings
+  # per-worker view: each uvicorn worker owns its own pool
+  return JSONResponse(content={
+        'client_options': client_options(settings),
+        'list_read_preference': settings.mongo_list_read_preference,
+        'servers': pool_stats.snapshot()
+    }, status_code=200)
+
+@router.get('/diagnostics/startup',tags=['root'],include_in_schema=False)
+def startup_diagnostics():
+  return JSONResponse(content=startup_report.summary(), status_code=200)
@@ -0,0 +1,142 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends
+from mongoengine.errors import ValidationError as DocumentValidationError
+from model.project_model import Project
+from schemas.project_schema import BulkProjectCreate, BulkProjectUpdate, BulkProjectDelete
+from schemas.project_schema_response_model import BulkItemResult, BulkOperationResponse, ErrorResponse
+from jwt_auth.principal_cache import Principal
+from jwt_auth.authorization import require
+from repository.project_repository import project_repository
+from repository.base_repository import to_object_id
+from exceptions.project_exception import *
+
+router = APIRouter()
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def item_failed(index: int, exc: BaseAPIException) -> BulkItemResult:
+    return BulkItemResult(index=index, status="failed", error_code=exc.error_code, detail=exc.detail)
+
+
+def write_error_exception(error: dict) -> BaseAPIException:
+    if error.get("code") == DUPLICATE_KEY_ERROR:
+        return ProjectAlreadyExistsException()
+    return InternalServerErrorException(detail=error.get("errmsg", "Write failed"))
+
+
+def bulk_response(results: List[Optional[BulkItemResult]], ordered: bool, message: str) -> BulkOperationResponse:
+    # an ordered batch stops at its first failure; nothing after it was written
+    first_failure = next((r.index for r in results if r is not None and r.status == "failed"), None)
+    for index, result in enumerate(results):
+        if result is None or (ordered and first_failure is not None and index > first_failure):
+            results[index] = BulkItemResult(index=index, status="skipped")
+    failed = sum(1 for r in results if r.status == "failed") # type: ignore
+    succeeded = sum(1 for r in results if r.status not in ("failed", "skipped")) # type: ignore
+    return BulkOperationResponse(message=message, succeeded=succeeded, failed=failed, results=results) # type: ignore
+
+
+def parse_ids(ids: List[str]):
+    """ObjectId per position, or the exception for an invalid id or a repeat of an earlier position."""
+    parsed, seen = [], set()
+    for id in ids:
+        object_id = to_object_id(id)
+        if object_id is None:
+            parsed.append(InvalidInputException(detail="Invalid project id"))
+        elif object_id in seen:
+            # a second operation on the same id would be reported as done without doing anything
+            parsed.append(InvalidInputException(detail="Project id repeated in this batch"))
+        else:
+            seen.add(object_id)
+            parsed.append(object_id)
+    return parsed
+
+
+async def resolve_ids(ids: List[str]):
+    """Like parse_ids, with ProjectNotFound for ids that do not exist, found with a single query."""
+    parsed = parse_ids(ids)
+    existing = await project_repository.existing_ids(r for r in parsed if not isinstance(r, BaseAPIException))
+    return [r if isinstance(r, BaseAPIException) or r in existing else ProjectNotFound() for r in parsed]
+
+
+@router.post('/createprojects', response_model=BulkOperationResponse, responses={400: {"model": ErrorResponse}, 403: {"model": ErrorResponse}}, tags=['projects'])
+async def create_projects_bulk(body: BulkProjectCreate, user: Principal = Depends(require("projects:create"))):
+    results: List[Optional[BulkItemResult]] = [None] * len(body.projects)
+    docs, positions = [], []
+    for index, item in enumerate(body.projects):
+        doc = Project(name=item.title, description=item.description, created_by=user.username, owner_id=to_object_id(user.id))
+        try:
+            doc.validate()
+        except DocumentValidationError as e:
+            results[index] = item_failed(index, ValidationException(detail=str(e)))
+            if body.ordered:
+                break
+            continue
+        docs.append(doc)
+        positions.append(index)
+
+    errors = await project_repository.insert_many(docs, ordered=body.ordered) if docs else {}
+    for position, (index, doc) in enumerate(zip(positions, docs)):
+        if position in errors:
+            results[index] = item_failed(index, write_error_exception(errors[position]))
+        else:
+            results[index] = BulkItemResult(index=index, status="created", project_id=str(doc.id))
+    return bulk_response(results, body.ordered, "Bulk project creation processed")
+
+
+@router.patch('/updateprojects', response_model=BulkOperationResponse, responses={400: {"model": ErrorResponse}, 403: {"model": ErrorResponse}}, tags=['projects'])
+async def update_projects_bulk(body: BulkProjectUpdate, user: Principal = Depends(require("projects:update"))):
+    results: List[Optional[BulkItemResult]] = [None] * len(body.projects)
+    resolved = await resolve_ids([item.id for item in body.projects])
+    updates, positions = [], []
+    for index, (item, object_id) in enumerate(zip(body.projects, resolved)):
+        if isinstance(object_id, BaseAPIException):
+            results[index] = item_failed(index, object_id)
+            if body.ordered:
+                break
+            continue
+        fields = {}
+        if item.title:
+            fields["name"] = item.title
+        if item.description:
+            fields["description"] = item.description
+        if not fields:
+            results[index] = BulkItemResult(index=index, status="updated", project_id=item.id)
+            continue
+        updates.append((object_id, fields))
+        positions.append(index)
+
+    errors = await project_repository.bulk_update(updates, ordered=body.ordered) if updates else {}
+    # an id deleted between resolve_ids and the write matched nothing; it is gone now either way
+    still_there = await project_repository.existing_ids(object_id for object_id, _ in updates) if updates else set()
+    for position, index in enumerate(positions):
+        if position in errors:
+            results[index] = item_failed(index, write_error_exception(errors[position]))
+        elif updates[position][0] not in still_there:
+            results[index] = item_failed(index, ProjectNotFound())
+        else:
+            results[index] = BulkItemResult(index=index, status="updated", project_id=body.projects[index].id)
+    return bulk_response(results, body.ordered, "Bulk project update processed")
+
+
+@router.post('/deleteprojects', response_model=BulkOperationResponse, responses={400: {"model": ErrorResponse}, 403: {"model": ErrorResponse}}, tags=['projects'])
+async def delete_projects_bulk(body: BulkProjectDelete, user: Principal = Depends(require("projects:delete"))):
+    results: List[Optional[BulkItemResult]] = [None] * len(body.ids)
+    deletes, positions = [], []
+    for index, object_id in enumerate(parse_ids(body.ids)):
+        if isinstance(object_id, BaseAPIException):
+            results[index] = item_failed(index, object_id)
+            if body.ordered:
+                break
+            continue
+        deletes.append(object_id)
+        positions.append(index)
+
+    # each id's own deleted_count decides its status, so an id deleted elsewhere first is reported as not found
+    outcomes = await project_repository.delete_each(deletes, ordered=body.ordered) if deletes else []
+    for index, deleted in zip(positions, outcomes):
+        if deleted:
+            results[index] = BulkItemResult(index=index, status="deleted", project_id=body.ids[index])
+        elif deleted is False:
+            results[index] = item_failed(index, ProjectNotFound())
+    return bulk_response(results, body.ordered, "Bulk project deletion processed")
@@ -0,0 +1,64 @@
+import zlib
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from dotenv import load_dotenv
+import orjson
+from schemas.project_schema import ExportWatermark
+from schemas.project_schema_response_model import ErrorResponse
+from jwt_auth.principal_cache import Principal
+from jwt_auth.authorization import require
+from repository.project_repository import project_repository
+from repository.base_repository import to_object_id
+from exceptions.project_exception import InvalidInputException
+import os
+
+load_dotenv()
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+router = APIRouter()
+
+
+async def ndjson_lines(since: Optional[datetime], after_id, watermark: str):
+    async for batch in project_repository.export_batches(since, after_id, watermark, EXPORT_BATCH_SIZE):
+        chunk = bytearray()
+        for row in batch:
+            row["id"] = str(row.pop("_id"))
+            chunk += orjson.dumps(row)
+            chunk += b"\n"
+        yield bytes(chunk)
+
+
+async def gzipped(chunks):
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+@router.get('/exportprojects', tags=['projects'], response_class=StreamingResponse, responses={
+    200: {"content": {"application/x-ndjson": {}}, "description": "One project JSON object per line"},
+    400: {"model": ErrorResponse},
+    403: {"model": ErrorResponse},
+})
+async def export_projects(user: Principal = Depends(require("projects:export")),
+                          since: Optional[datetime] = Query(None, description="Only projects whose watermark is strictly after this timestamp"),
+                          after_id: Optional[str] = Query(None, description="With since, also include projects at exactly since whose id sorts after this one"),
+                          watermark: ExportWatermark = Query(ExportWatermark.updated_at, description="Field compared with since and used for ordering"),
+                          gzip: bool = Query(False, description="gzip-compress the stream")):
+    # rows stream in (watermark, id) order, so the last line's watermark and id resume the next call
+    after = None
+    if after_id is not None:
+        after = to_object_id(after_id)
+        if after is None or since is None:
+            raise InvalidInputException(detail="after_id must be a project id and requires since")
+    body = ndjson_lines(since, after, watermark.value)
+    headers = {}
+    if gzip:
+        body = gzipped(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
@@ -1,131 +1,125 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query, status,Request,FastAPI
-from fastapi.responses import JSONResponse
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Header, status,Request,FastAPI
+from fastapi.responses import JSONResponse, Response
+import orjson
 from pydantic import ValidationError
+from pymongo.errors import DuplicateKeyError
 from model.project_model import Project
-from model.user_model import User
-from schemas.project_schema import ProjectCreate,ProjectUpdatePatch
-from jwt_auth.token_validation import JWTBearer
+from schemas.project_schema import ProjectCreate,ProjectUpdatePatch,CountMode
+from jwt_auth.principal_cache import Principal
+from jwt_auth.authorization import require, require_owned, ProjectAccess
+from repository.project_repository import project_repository
+from repository.base_repository import to_object_id
+from repository.pagination import encode_cursor, decode_cursor, encode_search_cursor, decode_search_cursor
+from services.response_cache import project_list_cache, etag_matches
 from fastapi.exceptions import RequestValidationError
 from exceptions.project_exception import *
 from schemas.project_schema_response_model import *
 router = APIRouter()
 app = FastAPI()
 
-def get_user_from_token(token_payload: dict):
-    user_id = token_payload.get("user_id")
-    if not user_id:
-        raise UserNotFoundException()
-    user = User.objects.filter(id=user_id).first()  # type: ignore
-    if not user:
-        raise UserNotFound()
-    return user
-
-def check_user_admin_role(user):
-    if user.role != 'admin':
-        raise UnauthorizedActionException()
-
-def get_project_by_id(id: str):
-    project = Project.objects.filter(id=id).first()  # type: ignore
+async def get_project_by_id(id: str, owner_id: Optional[str] = None):
+    project = await project_repository.get_by_id(id)
     if not project:
         raise ProjectNotFound()
+    if owner_id is not None and str(project.owner_id) != owner_id:
+        raise ProjectAccessForbiddenException()
     return project
 
-def create_new_project(title: str, description: str, created_by: str):
-    new_project = Project(name=title, description=description, created_by=created_by)
-    new_project.save()
-    return new_project
+async def create_new_project(title: str, description: str, owner: Principal):
+    new_project = Project(name=title, description=description, created_by=owner.username, owner_id=to_object_id(owner.id))
+    return await project_repository.insert(new_project)
 
-@router.post('/createproject', response_model=SuccessResponse, responses={400: {"model": ErrorResponse}},tags=['projects'])
-def create_projects(project: ProjectCreate, token_payload: dict = Depends(JWTBearer())):
+@router.post('/createproject', response_model=SuccessResponse, responses={400: {"model": ErrorResponse}, 403: {"model": ErrorResponse}, 409: {"model": ErrorResponse}},tags=['projects'])
+async def create_projects(project: ProjectCreate, user: Principal = Depends(require("projects:create"))):
     try:
-        user = get_user_from_token(token_payload)
-        if user.role != 'admin':
-            raise UnauthorizedActionException()
-        existing_project = Project.objects(name=project.title).first()  # type: ignore
-        if existing_project:
-            raise ProjectAlreadyExistsException()
-        new_project = create_new_project(project.title, project.description, user.username)
-        return SuccessResponse(
-            message="Project created successfully",
-            data={"project_id": str(new_project.id)} # type: ignore
-        )
-    except ProjectAlreadyExistsException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except UnauthorizedActionException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except ValidationException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except Exception as e:
-        raise InternalServerErrorException(detail=str(e))
-
-@router.put('/updateproject/{id}', response_model=SuccessResponse, responses={400: {"model": ErrorResponse}},tags=['projects'])
-def update_project_put(id: str,project: ProjectCreate,token_payload: dict = Depends(JWTBearer())):
+        new_project = await create_new_project(project.title, project.description, user)
+    except DuplicateKeyError:
+        raise ProjectAlreadyExistsException()
+    return SuccessResponse(
+        message="Project created successfully",
+        data={"project_id": str(new_project.id)} # type: ignore
+    )
+
+@router.put('/updateproject/{id}', response_model=SuccessResponse, responses={400: {"model": ErrorResponse}, 403: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 409: {"model": ErrorResponse}},tags=['projects'])
+async def update_project_put(id: str,project: ProjectCreate,access: ProjectAccess = Depends(require_owned("projects:update"))):
+    project_to_update = await get_project_by_id(id, access.owner_id)
+
+    project_to_update.name = project.title
+    project_to_update.description = project.description
     try:
-        user = get_user_from_token(token_payload)
-        check_user_admin_role(user)
-
-        project_to_update = get_project_by_id(id)
-
+        await project_repository.update(project_to_update)
+    except DuplicateKeyError:
+        raise ProjectAlreadyExistsException()
+    return SuccessResponse(
+        message="Project updated using PUT successfully",
+        data={"project_id": str(project_to_update.id)}
+    )
+
+@router.patch('/updateproject/{id}',response_model=SuccessResponse, responses={400: {"model": ErrorResponse}, 403: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 409: {"model": ErrorResponse}}, tags=['projects'])
+async def update_project_patch(id: str,project: ProjectUpdatePatch,access: ProjectAccess = Depends(require_owned("projects:update"))):
+    project_to_update = await get_project_by_id(id, access.owner_id)
+
+    if project.title:
         project_to_update.name = project.title
+    if project.description:
         project_to_update.description = project.description
-        project_to_update.save()
-        return SuccessResponse(
-            message="Project updated using PUT successfully",
-            data={"project_id": str(project_to_update.id)}
-        )
-    except ProjectAlreadyExistsException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except UnauthorizedActionException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except ValidationException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except Exception as e:
-        raise InternalServerErrorException(detail=str(e))
-
-@router.patch('/updateproject/{id}',response_model=SuccessResponse, responses={400: {"model": ErrorResponse}}, tags=['projects'])
-def update_project_patch(id: str,project: ProjectUpdatePatch,token_payload: dict = Depends(JWTBearer())):
-    try:
-        user = get_user_from_token(token_payload)
-        check_user_admin_role(user)
-
-        project_to_update = get_project_by_id(id)
-
-        if project.title:
-            project_to_update.name = project.title
-        if project.description:
-            project_to_update.description = project.description
-        
-        project_to_update.save()
-
-        return SuccessResponse(
-            message="Project updated using PATCH successfully",
-            data={"project_id": str(project_to_update.id)}
-        )
-    except ProjectAlreadyExistsException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except UnauthorizedActionException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except ValidationException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
-    except Exception as e:
-        raise InternalServerErrorException(detail=str(e))
-
-@router.delete('/delete/{id}', response_model=SuccessResponse, responses={400: {"model": ErrorResponse}}, tags=['projects'])
-def delete_project( id: str,token_payload: dict = Depends(JWTBearer())):
+    
     try:
-        user = get_user_from_token(token_payload)
-        check_user_admin_role(user)
-
-        project_to_delete = get_project_by_id(id)
+        await project_repository.update(project_to_update)
+    except DuplicateKeyError:
+        raise ProjectAlreadyExistsException()
+
+    return SuccessResponse(
+        message="Project updated using PATCH successfully",
+        data={"project_id": str(project_to_update.id)}
+    )
+
+@router.delete('/delete/{id}', response_model=SuccessResponse, responses={400: {"model": ErrorResponse}, 403: {"model": ErrorResponse}, 404: {"model": ErrorResponse}}, tags=['projects'])
+async def delete_project( id: str,access: ProjectAccess = Depends(require_owned("projects:delete"))):
+    project_to_delete = await get_project_by_id(id, access.owner_id)
+
+    await project_repository.delete(project_to_delete)
+    return SuccessResponse(
+        message="Project deleted successfully",
+        data={"project_id": str(project_to_delete.id)}
+    )
+
+async def build_project_page(page: int, page_size: int, cursor: Optional[str], count: CountMode) -> bytes:
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            raise InvalidInputException(detail=str(e))
+        projects = await project_repository.list_after_rows(after, page_size)
+    else:
+        offset=(page-1)*page_size
+        limit=page_size
+        projects = await project_repository.list_page_rows(offset, limit)
+    total_project, total_project_exact = await project_repository.count(count.value)
+    if not projects:
+        raise ProjectNotFound()
 
-        project_to_delete.delete()
-        return SuccessResponse(
-            message="Project deleted successfully",
-            data={"project_id": str(project_to_delete.id)}
-        )
-    except Exception as e:
-        raise InternalServerErrorException(detail=str(e))
+    return page_body(projects, total_project, total_project_exact, None if cursor else page, page_size)
+
+def page_body(projects: list, total_project: int, total_project_exact: bool, page: Optional[int], page_size: int,
+              cursor_for=lambda row: encode_cursor(row["created_at"], row["id"])) -> bytes:
+    # projected rows already have the ProjectDetailResponse shape apart from _id,
+    # so they go straight to orjson instead of Document -> dict -> pydantic
+    for project in projects:
+        project["id"] = str(project.pop("_id"))
+    last = projects[-1]
+
+    return orjson.dumps({
+        "message": "Project Details Fetched Successfully",
+        "projects": projects,
+        "total_project": total_project,
+        "total_project_exact": total_project_exact,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": cursor_for(last) if len(projects) == page_size else None
+    })
 
 @router.get('/getprojects', response_model=GetProjectsResponse, responses={
     400: {"model": ErrorResponse},
@@ -133,46 +127,69 @@ def delete_project( id: str,token_payload: dict = Depends(JWTBearer())):
     404: {"model": ErrorResponse},
     500: {"model": ErrorResponse}
 }, tags=['projects'])
-def get_projects(token_payload: dict = Depends(JWTBearer()),
+async def get_projects(user: Principal = Depends(require("projects:read")),
                  page:int =Query(1,ge=1,description="page number"),
-                 page_size:int=Query(2,ge=1,le=100,description="Number of items per page (Default is 2)")) -> GetProjectsResponse:
+                 page_size:int=Query(2,ge=1,le=100,description="Number of items per page (Default is 2)"),
+                 cursor:Optional[str]=Query(None,description="next_cursor from a previous response; when set, page is ignored"),
+                 count:CountMode=Query(CountMode.exact,description="How total_project is computed: exact, cached or estimated"),
+                 if_none_match:Optional[str]=Header(None)) -> GetProjectsResponse:
+    cache_key = ("cursor", cursor, page_size, count.value) if cursor else ("page", page, page_size, count.value)
+    cached = project_list_cache.get(cache_key)
+    if cached is None:
+        generation = project_list_cache.generation
+        body = await build_project_page(page, page_size, cursor, count)
+        cached = project_list_cache.put(cache_key, body, generation)
+
+    headers = {"ETag": cached.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+@router.get('/myprojects', response_model=GetProjectsResponse, responses={
+    400: {"model": ErrorResponse},
+    403: {"model": ErrorResponse},
+    404: {"model": ErrorResponse},
+    500: {"model": ErrorResponse}
+}, tags=['projects'])
+async def get_my_projects(user: Principal = Depends(require("projects:read")),
+                 page_size:int=Query(10,ge=1,le=100,description="Number of items per page (Default is 10)"),
+                 cursor:Optional[str]=Query(None,description="next_cursor from a previous response")) -> GetProjectsResponse:
+    owner_id = to_object_id(user.id)
     try:
-        user = get_user_from_token(token_payload)
-        
-        if user.role != 'user':
-            raise ProjectAccessForbiddenException()
-        
-        offset=(page-1)*page_size
-        limit=page_size
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise InvalidInputException(detail=str(e))
+    projects = await project_repository.list_owned_rows(owner_id, after, page_size)
+    if not projects:
+        raise ProjectNotFound()
+    total_project = await project_repository.count_owned(owner_id)
+    return Response(content=page_body(projects, total_project, True, None, page_size), media_type="application/json") # type: ignore
 
-        projects = Project.objects.all()  # type: ignore
-        projects=Project.objects.skip(offset).limit(limit) #type: ignore
-        total_project=Project.objects.count() # type: ignore
-        if not projects:
-            raise ProjectNotFound()
-
-        project_list = [
-            {
-                "id": str(project.id),
-                "name": project.name,
-                "description": project.description,
-                "created_by": project.created_by,
-                "created_at": project.created_at
-            }
-            for project in projects
-        ]
-
-        return GetProjectsResponse(
-            message="Project Details Fetched Successfully",
-            projects=project_list,  # type: ignore
-            total_project=total_project,  # Optional: Include total for client reference # type: ignore
-            page=page,# type: ignore
-            page_size=page_size# type: ignore
-        )
-
-    except ProjectAccessForbiddenException:
-        raise HTTPException(status_code=403, detail="Access forbidden: insufficient permissions.")
-    except ProjectNotFound:
-        raise HTTPException(status_code=404, detail="No projects found.")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+@router.get('/searchprojects', response_model=GetProjectsResponse, responses={
+    400: {"model": ErrorResponse},
+    403: {"model": ErrorResponse},
+    404: {"model": ErrorResponse},
+    500: {"model": ErrorResponse}
+}, tags=['projects'])
+async def search_projects(user: Principal = Depends(require("projects:read")),
+                 q:Optional[str]=Query(None,min_length=1,max_length=200,description="Words to match in name or description; results are ordered by relevance"),
+                 name_prefix:Optional[str]=Query(None,min_length=1,max_length=200,description="Case-sensitive prefix of the project name"),
+                 created_by:Optional[str]=Query(None,description="Username of the creator"),
+                 created_after:Optional[datetime]=Query(None,description="Only projects created at or after this time"),
+                 created_before:Optional[datetime]=Query(None,description="Only projects created before this time"),
+                 page_size:int=Query(10,ge=1,le=100,description="Number of items per page (Default is 10)"),
+                 cursor:Optional[str]=Query(None,description="next_cursor from a previous response with the same filters")) -> GetProjectsResponse:
+    # relevance when searching text, else name order for prefix lookups, else creation order
+    order = "score" if q else "name" if name_prefix else "created_at"
+    try:
+        after = decode_search_cursor(cursor, order) if cursor else None
+    except ValueError as e:
+        raise InvalidInputException(detail=str(e))
+    query = project_repository.search_filter(q, name_prefix, created_by.lower() if created_by else None, created_after, created_before)
+    projects = await project_repository.search_rows(query, order, after, page_size)
+    if not projects:
+        raise ProjectNotFound()
+    total_project = await project_repository.count_matching(query)
+    body = page_body(projects, total_project, True, None, page_size,
+                     cursor_for=lambda row: encode_search_cursor(order, row[order], row["id"]))
+    return Response(content=body, media_type="application/json") # type: ignore
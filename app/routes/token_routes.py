@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends
+from schemas.user_schema import RefreshTokenRequest, LogoutRequest
+from schemas.user_schema_response_models import SuccessResponse, LoginResponse
+from schemas.project_schema_response_model import ErrorResponse
+from exceptions.user_exception import *
+from jwt_auth.token_validation import JWTBearer
+from jwt_auth.token_security import sign_user_jwt, keyring
+from jwt_auth.token_cache import token_expiry
+from jwt_auth.token_revocation import revoke_jti
+from jwt_auth.refresh_tokens import rotate_refresh_token, revoke_refresh_token
+from repository.token_repository import revoked_token_repository
+
+router = APIRouter()
+
+@router.post("/token/refresh", response_model=LoginResponse, responses={
+        401: {"description": "Invalid Refresh Token", "model": ErrorResponse},
+        404: {"description": "User Not Found", "model": ErrorResponse},
+    },tags=['users']
+)
+async def refresh_access_token(body: RefreshTokenRequest):
+    existing_user, refresh_token = await rotate_refresh_token(body.refresh_token)
+    return LoginResponse(message="Token refreshed successfully.", token=sign_user_jwt(existing_user), refresh_token=refresh_token)
+
+@router.post("/logout", response_model=SuccessResponse, tags=['users'])
+async def logout(body: Optional[LogoutRequest] = None, token_payload: dict = Depends(JWTBearer())):
+    jti = token_payload.get("jti")
+    expires = token_expiry(token_payload)
+    if jti and expires:
+        revoke_jti(jti, expires)
+        await revoked_token_repository.add(jti, datetime.utcfromtimestamp(expires))
+    if body and body.refresh_token:
+        await revoke_refresh_token(body.refresh_token)
+    return SuccessResponse(message="Logged out successfully.")
+
+@router.get("/.well-known/jwks.json", tags=['users'])
+def jwks():
+    return keyring.jwks
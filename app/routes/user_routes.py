@@ -1,53 +1,40 @@
-from fastapi import APIRouter, HTTPException, status
-from schemas.user_schema import UserCreate, UserLogin
+from fastapi import APIRouter, HTTPException, status, Depends
+from schemas.user_schema import UserCreate, UserLogin, ChangePasswordRequest
 from model.user_model import User
-from schemas.user_schema_response_models import SuccessResponse, LoginResponse, ErrorResponse, UserRegistrationResponse
+from schemas.user_schema_response_models import SuccessResponse, LoginResponse, UserRegistrationResponse
+from schemas.project_schema_response_model import ErrorResponse
 from exceptions.user_exception import *
 from fastapi.responses import JSONResponse
-from jwt_auth.token_security import sign_jwt
-import re
+from pymongo.errors import DuplicateKeyError
+from jwt_auth.token_security import sign_user_jwt
+from jwt_auth.refresh_tokens import issue_refresh_token
+from jwt_auth.token_validation import JWTBearer
+from services.hash_pool import hash_pool
+from jwt_auth.policy import is_known_role
+from services.rate_limiter import rate_limiter, limit_by_ip, LOGIN_IP, LOGIN_USERNAME, REGISTER_IP
+from repository.user_repository import user_repository
 
 router = APIRouter()
 
-# Password strength check function
-def is_strong_password(password: str) -> bool:
-    if (
-        len(password) >= 8
-        and re.search(r"\d", password)
-        and re.search(r"[a-z]", password)
-        and re.search(r"[A-Z]", password)
-        and re.search(r"[!@#$%^&*(),.?\":{}|<>]", password)
-    ):
-        return True
-    else:
-        raise WeakPasswordException()
-
-# Username validation function
-def is_correct_username(username: str):
-    if not re.match(r"^[a-zA-Z0-9_]+$", username):
-        raise InvalidUsernameException()
-
 @router.post("/register", response_model=UserRegistrationResponse, responses={
         400: {"description": "Bad Request", "model": ErrorResponse},
         422: {"description": "Validation Error", "model": ErrorResponse},
-    },tags=['users']
+        429: {"description": "Too Many Requests", "model": ErrorResponse},
+        503: {"description": "Hashing Pool Busy", "model": ErrorResponse},
+    },tags=['users'],dependencies=[Depends(limit_by_ip(REGISTER_IP))]
 )
-def register(user: UserCreate):
-    if not user.username or not user.password:
-        raise UsernameAndPasswordRequired()
-    is_correct_username(user.username)
+async def register(user: UserCreate):
+    # username and password rules are enforced by UserCreate's validators
     normalize_username = user.username.lower()
     normalize_role = user.role.lower() if user.role else "user"
-    if normalize_role not in ("admin", "user"):
+    if not is_known_role(normalize_role):
         raise InvalidRoleException()
-    is_strong_password(user.password)
-    existing_user = User.objects(username=normalize_username).first()  # type: ignore
-    if existing_user:
-        raise UserAlreadyExistsException()
-
     new_user = User(username=normalize_username, role=normalize_role)
-    new_user.set_password(user.password)
-    new_user.save()
+    await hash_pool.run(new_user.set_password, user.password)
+    try:
+        await user_repository.insert(new_user)
+    except DuplicateKeyError:
+        raise UserAlreadyExistsException()
 
     return UserRegistrationResponse(
         id=str(new_user.id),  # type: ignore
@@ -59,20 +46,53 @@ def register(user: UserCreate):
 @router.post("/login", response_model=LoginResponse,responses={
         400: {"description": "Invalid Credentials", "model": ErrorResponse},
         404: {"description": "User Not Found", "model": ErrorResponse},
-    },tags=['users']
+        429: {"description": "Too Many Requests", "model": ErrorResponse},
+        503: {"description": "Hashing Pool Busy", "model": ErrorResponse},
+    },tags=['users'],dependencies=[Depends(limit_by_ip(LOGIN_IP))]
 )
-def login(user: UserLogin):
+async def login(user: UserLogin):
     if not user.username or not user.password:
         raise UsernameAndPasswordRequired()
 
     normalize_username = user.username.lower()
-    existing_user = User.objects(username=normalize_username).first()  # type: ignore
+    await rate_limiter.check(LOGIN_USERNAME, normalize_username, count=False)
+    existing_user = await user_repository.find_by_username(normalize_username)
     if not existing_user:
+        await rate_limiter.record(LOGIN_USERNAME, normalize_username)
         raise UserNotFoundException()
 
-    if not existing_user.verify_password(user.password):
+    is_valid, rehashed = await hash_pool.run(existing_user.verify_and_update_password, user.password)
+    if not is_valid:
+        await rate_limiter.record(LOGIN_USERNAME, normalize_username)
         raise InvalidCredentialsException()
+    if rehashed:
+        await user_repository.update(existing_user)
+
+    token = sign_user_jwt(existing_user)
+    refresh_token = await issue_refresh_token(existing_user)
+    return LoginResponse(message="Login successful.", token=token, refresh_token=refresh_token)
 
-    token = sign_jwt(str(existing_user.id))
-    return LoginResponse(message="Login successful.", token=token) 
+@router.post("/changepassword", response_model=LoginResponse, responses={
+        400: {"description": "Invalid Credentials", "model": ErrorResponse},
+        404: {"description": "User Not Found", "model": ErrorResponse},
+        422: {"description": "Validation Error", "model": ErrorResponse},
+        429: {"description": "Too Many Requests", "model": ErrorResponse},
+        503: {"description": "Hashing Pool Busy", "model": ErrorResponse},
+    },tags=['users'],dependencies=[Depends(limit_by_ip(LOGIN_IP))]
+)
+async def change_password(body: ChangePasswordRequest, token_payload: dict = Depends(JWTBearer())):
+    existing_user = await user_repository.get_by_id(token_payload.get("sub"))
+    if not existing_user:
+        raise UserNotFoundException()
+    await rate_limiter.check(LOGIN_USERNAME, existing_user.username, count=False)
+    if not await hash_pool.run(existing_user.verify_password, body.current_password):
+        await rate_limiter.record(LOGIN_USERNAME, existing_user.username)
+        raise InvalidCredentialsException()
+    await hash_pool.run(existing_user.set_password, body.new_password)
+    # every access token issued before the change is rejected, in every worker
+    existing_user.revoke_tokens()
+    await user_repository.update(existing_user)
 
+    token = sign_user_jwt(existing_user)
+    refresh_token = await issue_refresh_token(existing_user)
+    return LoginResponse(message="Password changed successfully.", token=token, refresh_token=refresh_token)
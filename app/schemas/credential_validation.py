@@ -0,0 +1,46 @@
+import re
+import string
+
+PASSWORD_MIN_LENGTH = 8
+PASSWORD_SPECIAL_CHARACTERS = '!@#$%^&*(),.?":{}|<>'
+USERNAME_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+
+DIGIT, LOWER, UPPER, SPECIAL = 1, 2, 4, 8
+
+# character -> class bit, so one pass over the password answers every class rule
+_CHARACTER_CLASSES = {
+    **{c: DIGIT for c in string.digits},
+    **{c: LOWER for c in string.ascii_lowercase},
+    **{c: UPPER for c in string.ascii_uppercase},
+    **{c: SPECIAL for c in PASSWORD_SPECIAL_CHARACTERS},
+}
+_ALL_CLASSES = DIGIT | LOWER | UPPER | SPECIAL
+
+PASSWORD_RULES = (
+    (DIGIT, "at least one digit"),
+    (LOWER, "at least one lowercase letter"),
+    (UPPER, "at least one uppercase letter"),
+    (SPECIAL, "at least one special character (%s)" % PASSWORD_SPECIAL_CHARACTERS),
+)
+
+
+def password_failures(password: str) -> list:
+    """Every password rule the value breaks; empty when it is strong enough."""
+    failures = []
+    if len(password) < PASSWORD_MIN_LENGTH:
+        failures.append("at least %d characters" % PASSWORD_MIN_LENGTH)
+    found = 0
+    classes = _CHARACTER_CLASSES
+    for c in password:
+        found |= classes.get(c, 0)
+        if found == _ALL_CLASSES:
+            break
+    if found != _ALL_CLASSES:
+        failures.extend(message for bit, message in PASSWORD_RULES if not found & bit)
+    return failures
+
+
+def username_failures(username: str) -> list:
+    if USERNAME_PATTERN.fullmatch(username):
+        return []
+    return ["only letters, numbers and underscores"]
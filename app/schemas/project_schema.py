@@ -1,6 +1,14 @@
 from pydantic import BaseModel,Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+from enum import Enum
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+# checked while the body is validated, before any item of an oversized batch is built
+BULK_MAX_OPERATIONS = int(os.getenv("BULK_MAX_OPERATIONS", "1000"))
 
 class ProjectCreate(BaseModel):
   title: str
@@ -9,3 +17,27 @@ class ProjectCreate(BaseModel):
 class ProjectUpdatePatch(BaseModel):
   title: Optional[str] = None
   description: Optional[str] = None
+
+class ProjectBulkUpdateItem(ProjectUpdatePatch):
+  id: str
+
+class BulkProjectCreate(BaseModel):
+  projects: List[ProjectCreate] = Field(max_length=BULK_MAX_OPERATIONS)
+  ordered: bool = True  # stop at the first failure, like Mongo ordered bulk writes
+
+class BulkProjectUpdate(BaseModel):
+  projects: List[ProjectBulkUpdateItem] = Field(max_length=BULK_MAX_OPERATIONS)
+  ordered: bool = True
+
+class BulkProjectDelete(BaseModel):
+  ids: List[str] = Field(max_length=BULK_MAX_OPERATIONS)
+  ordered: bool = True
+
+class CountMode(str, Enum):
+  exact = "exact"
+  cached = "cached"
+  estimated = "estimated"
+
+class ExportWatermark(str, Enum):
+  created_at = "created_at"
+  updated_at = "updated_at"
@@ -18,10 +18,27 @@ class ProjectDetailResponse(BaseModel):
     description: Optional[str] = Field(None, description="A brief description of the project")
     created_by: str = Field(..., description="The username of the creator")
     created_at: datetime = Field(..., description="The timestamp when the project was created")
+    updated_at: Optional[datetime] = Field(None, description="The timestamp of the last change to the project")
+    score: Optional[float] = Field(None, description="Text relevance, only set by /searchprojects?q=")
 
 class GetProjectsResponse(BaseModel):
     message: str = Field(..., description="The status message of the API response")
     projects: List[ProjectDetailResponse] = Field(..., description="A list of projects with their details")
     total_project: int  # Add this field
-    page: int  # Add this field
-    page_size: int  # Add this field
\ No newline at end of file
+    total_project_exact: bool = Field(True, description="False when total_project is a cached or estimated value")
+    page: Optional[int] = None  # None when paging by cursor
+    page_size: int  # Add this field
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page, pass it back as ?cursor=")
+
+class BulkItemResult(BaseModel):
+    index: int = Field(..., description="Position of the item in the request")
+    status: str = Field(..., description="created, updated, deleted, failed or skipped")
+    project_id: Optional[str] = None
+    error_code: Optional[str] = None
+    detail: Optional[str] = None
+
+class BulkOperationResponse(BaseModel):
+    message: str
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
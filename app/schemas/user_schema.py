@@ -1,10 +1,45 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+from pydantic_core import PydanticCustomError
+from typing import Optional
+from schemas.credential_validation import password_failures, username_failures
 
 class UserCreate(BaseModel):
     username: str = Field(..., example="admin1") # type: ignore
     password: str = Field(..., example="Password@123") # type: ignore
     role: str = Field(None, example="user") # type: ignore
 
+    # rejected as a 422 listing every failed rule, before any database or bcrypt work
+    @field_validator("username")
+    @classmethod
+    def check_username(cls, value: str) -> str:
+        failures = username_failures(value)
+        if failures:
+            raise PydanticCustomError("invalid_username", "Username must contain {failed_rules}", {"failed_rules": "; ".join(failures)})
+        return value
+
+    @field_validator("password")
+    @classmethod
+    def check_password(cls, value: str) -> str:
+        failures = password_failures(value)
+        if failures:
+            raise PydanticCustomError("weak_password", "Password must contain {failed_rules}", {"failed_rules": "; ".join(failures)})
+        return value
+
+class ChangePasswordRequest(BaseModel):
+    current_password: str = Field(..., example="Password@123") # type: ignore
+    new_password: str = Field(..., example="N3w-Password@123") # type: ignore
+
+    @field_validator("new_password")
+    @classmethod
+    def check_new_password(cls, value: str) -> str:
+        return UserCreate.check_password(value)
+
 class UserLogin(BaseModel):
     username: str = Field(..., example="admin1") # type: ignore
-    password: str = Field(..., example="Password@123") # type: ignore
\ No newline at end of file
+    password: str = Field(..., example="Password@123") # type: ignore
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(..., example="refresh-token-from-login") # type: ignore
+
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = Field(None, example="refresh-token-from-login") # type: ignore
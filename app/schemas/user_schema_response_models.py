@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional
 
 class SuccessResponse(BaseModel):
     message: str = Field(..., example="Operation completed successfully.") # type: ignore
@@ -11,8 +11,4 @@ class UserRegistrationResponse(SuccessResponse):
 
 class LoginResponse(SuccessResponse):
     token: str 
-
-class ErrorResponse(BaseModel):
-    code: str = Field(..., example="ERROR_CODE") # type: ignore
-    message: str = Field(..., example="A user-friendly error message.") # type: ignore
-    details: Optional[List[str]] = Field(None, example=["Additional details about the error."]) # type: ignore
+    refresh_token: Optional[str] = None
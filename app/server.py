@@ -0,0 +1,40 @@
+"""Production entrypoint: python app/server.py [--workers N] [--port 8000]
+
+Modules under app/ import each other as top-level packages (routes, model, ...),
+so the server is started with app/ as its app dir regardless of the current directory.
+"""
+import argparse
+import importlib.util
+import os
+import uvicorn
+from settings import settings
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API with uvicorn.")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument("--workers", type=int, default=settings.workers)
+    parser.add_argument("--log-level", default=settings.log_level)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        "main:app",
+        app_dir=APP_DIR,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        # the C implementations when installed (uvicorn[standard]), pure-Python otherwise
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        lifespan="on",
+        log_level=args.log_level,
+        timeout_keep_alive=settings.keep_alive_timeout,
+        proxy_headers=settings.proxy_headers,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from exceptions.user_exception import ServiceBusyException
+import os
+
+load_dotenv()
+
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", str(os.cpu_count() or 2)))
+HASH_POOL_MAX_QUEUE = int(os.getenv("HASH_POOL_MAX_QUEUE", "64"))
+HASH_POOL_RETRY_AFTER = int(os.getenv("HASH_POOL_RETRY_AFTER", "1"))
+
+
+class HashingPool:
+    """Runs bcrypt work off the event loop with a hard cap on queued jobs.
+
+    bcrypt releases the GIL while hashing, so a thread pool scales with cores.
+    Once workers + max_queue jobs are in flight new work is rejected with 503
+    instead of queueing behind everything else.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self.rejected = 0
+
+    async def run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise ServiceBusyException(retry_after=HASH_POOL_RETRY_AFTER)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._slots.release()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # built on first use, and again after shutdown(), so a later app lifespan in the same process still works
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            return self._executor
+
+    def shutdown(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+hash_pool = HashingPool(workers=HASH_POOL_WORKERS, max_queue=HASH_POOL_MAX_QUEUE)
@@ -0,0 +1,40 @@
+import time
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+PROJECT_COUNT_CACHE_TTL = float(os.getenv("PROJECT_COUNT_CACHE_TTL", "30"))
+
+
+class ProjectCounter:
+    """Total project count for listings in one of three modes.
+
+    exact      count_documents on every call
+    cached     exact count reused for ttl seconds, dropped on create/delete in this process
+    estimated  collection metadata (estimated_document_count), no scan at all
+
+    count() returns (total, is_exact).
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._value = None
+        self._expires_at = 0.0
+
+    async def count(self, collection, mode: str = "exact"):
+        if mode == "estimated":
+            return await collection.estimated_document_count(), False
+        if mode == "cached":
+            if self._value is not None and time.monotonic() < self._expires_at:
+                return self._value, False
+            total = await collection.count_documents({})
+            self._value, self._expires_at = total, time.monotonic() + self.ttl
+            return total, True
+        return await collection.count_documents({}), True
+
+    def invalidate(self):
+        self._value = None
+
+
+project_counter = ProjectCounter(ttl=PROJECT_COUNT_CACHE_TTL)
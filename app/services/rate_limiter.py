@@ -0,0 +1,121 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from fastapi import Request
+from dotenv import load_dotenv
+from exceptions.user_exception import TooManyRequestsException
+import os
+from settings import _bool
+
+load_dotenv()
+
+RATE_LIMIT_ENABLED = _bool("RATE_LIMIT_ENABLED", "true")
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# only trust X-Forwarded-For when the app sits behind a proxy that sets it
+RATE_LIMIT_TRUST_FORWARDED = _bool("RATE_LIMIT_TRUST_FORWARDED", "false")
+
+
+class RateLimit:
+    def __init__(self, name: str, limit: int, window: float):
+        self.name = name
+        self.limit = limit
+        self.window = window
+
+    @classmethod
+    def from_env(cls, name: str, default: str) -> "RateLimit":
+        # "<attempts>/<seconds>", e.g. RATE_LIMIT_LOGIN_IP=20/60
+        limit, window = os.getenv(f"RATE_LIMIT_{name.upper()}", default).split("/")
+        return cls(name, int(limit), float(window))
+
+
+class RateLimiterBackend:
+    """Storage for attempt counters. A shared-store backend (e.g. Redis) implements the same hit()."""
+
+    async def hit(self, key: str, limit: int, window: float, count: bool = True) -> float:
+        """Returns 0 when allowed, else seconds until the caller may retry.
+
+        An allowed attempt is recorded unless count is False.
+        """
+        raise NotImplementedError
+
+
+class InMemorySlidingWindowBackend(RateLimiterBackend):
+    """Sliding-window counter: the previous fixed window is weighted by how much of it still overlaps.
+
+    Two integers per key instead of a timestamp log, and the least recently used keys are
+    dropped past max_keys so a spray of distinct IPs cannot grow memory without bound.
+    """
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS, clock=time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._windows: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def hit(self, key: str, limit: int, window: float, count: bool = True) -> float:
+        now = self.clock()
+        current_start = now - (now % window)
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None and not count:
+                return 0
+            if state is None or state[0] < current_start - window:
+                state = [current_start, 0, 0]
+            elif state[0] < current_start:
+                state = [current_start, 0, state[1]]
+            self._windows[key] = state
+            self._windows.move_to_end(key)
+            while len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+
+            _, current, previous = state
+            elapsed = now - current_start
+            if previous * (1 - elapsed / window) + current >= limit:
+                return window - elapsed
+            if count:
+                state[1] += 1
+            return 0
+
+
+class RateLimiter:
+    def __init__(self, backend: RateLimiterBackend):
+        self.backend = backend
+        self.rejected = 0
+
+    async def check(self, rule: RateLimit, key: str, count: bool = True):
+        """Raises TooManyRequestsException once key is over the limit; count=False only checks."""
+        if not RATE_LIMIT_ENABLED:
+            return
+        retry_after = await self.backend.hit(f"{rule.name}:{key}", rule.limit, rule.window, count)
+        if retry_after > 0:
+            self.rejected += 1
+            raise TooManyRequestsException(retry_after=max(1, math.ceil(retry_after)))
+
+    async def record(self, rule: RateLimit, key: str):
+        """Counts one attempt against key without rejecting the current request."""
+        if RATE_LIMIT_ENABLED:
+            await self.backend.hit(f"{rule.name}:{key}", rule.limit, rule.window)
+
+
+rate_limiter = RateLimiter(InMemorySlidingWindowBackend())
+
+LOGIN_IP = RateLimit.from_env("login_ip", "20/60")
+# only failed attempts count against a username, so its owner is not locked out by their own logins
+LOGIN_USERNAME = RateLimit.from_env("login_username", "5/60")
+REGISTER_IP = RateLimit.from_env("register_ip", "10/600")
+
+
+def client_ip(request: Request) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def limit_by_ip(rule: RateLimit):
+    """Dependency rejecting the request before its handler (and any bcrypt/DB work) runs."""
+    async def dependency(request: Request):
+        await rate_limiter.check(rule, client_ip(request))
+    return dependency
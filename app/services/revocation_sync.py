@@ -0,0 +1,46 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+from jwt_auth.token_revocation import revoke_jti, note_token_version, prune_revocations
+from jwt_auth.token_security import ACCESS_TOKEN_EXPIRE_SECONDS
+from repository.token_repository import revoked_token_repository
+from repository.user_repository import user_repository
+import os
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_SYNC_INTERVAL = float(os.getenv("REVOCATION_SYNC_INTERVAL", "15"))
+
+# re-read a little history each pass so writes racing the previous sync are not missed
+SYNC_OVERLAP = timedelta(seconds=5)
+
+_last_synced_at = None
+
+
+async def sync_revoked_tokens():
+    """Pulls jtis revoked and token versions bumped since the previous sync (by any worker) into memory."""
+    global _last_synced_at
+    started_at = datetime.utcnow()
+    since = _last_synced_at - SYNC_OVERLAP if _last_synced_at else None
+    for entry in await revoked_token_repository.revoked_since(since):
+        revoke_jti(entry["jti"], entry["expires_at"].replace(tzinfo=timezone.utc).timestamp())
+    # a bump older than the access token lifetime can no longer reject anything
+    bumped_since = since or started_at - timedelta(seconds=ACCESS_TOKEN_EXPIRE_SECONDS)
+    for user in await user_repository.tokens_revoked_since(bumped_since):
+        note_token_version(user["_id"], user["token_version"], user["tokens_revoked_at"].replace(tzinfo=timezone.utc).timestamp())
+    prune_revocations(time.time(), ACCESS_TOKEN_EXPIRE_SECONDS)
+    _last_synced_at = started_at
+
+
+async def revocation_sync_loop(interval: float = REVOCATION_SYNC_INTERVAL):
+    # the first sync already ran during startup
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await sync_revoked_tokens()
+        except Exception:
+            logger.exception("Revoked token sync failed")
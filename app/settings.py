@@ -0,0 +1,48 @@
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+
+def _bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes")
+
+
+class Settings:
+    """Server, MongoDB and startup settings, read from the environment (.env supported).
+
+    Passed to create_app(); feature settings (JWT, rate limits, caches, RBAC, metrics) are
+    module-level constants read by the module that uses them.
+    """
+
+    def __init__(self):
+        self.host = os.getenv("HOST", "0.0.0.0")
+        self.port = int(os.getenv("PORT", "8000"))
+        self.workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+        self.log_level = os.getenv("LOG_LEVEL", "info")
+        self.keep_alive_timeout = int(os.getenv("KEEP_ALIVE_TIMEOUT", "5"))
+        self.proxy_headers = _bool("PROXY_HEADERS", "false")
+
+        self.mongo_url = os.getenv("MONGODB_URL")
+        self.mongo_max_pool_size = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+        self.mongo_min_pool_size = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+        self.mongo_connect_timeout_ms = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+        self.mongo_socket_timeout_ms = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "20000"))
+        self.mongo_server_selection_timeout_ms = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+        # how long a request waits for a free pooled connection before failing (0 = forever)
+        self.mongo_wait_queue_timeout_ms = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "2000"))
+        self.mongo_read_preference = os.getenv("MONGO_READ_PREFERENCE", "primary")
+        # listing/count/export reads; e.g. secondaryPreferred to keep them off the primary
+        self.mongo_list_read_preference = os.getenv("MONGO_LIST_READ_PREFERENCE", self.mongo_read_preference)
+        self.mongo_write_concern = os.getenv("MONGO_WRITE_CONCERN")
+        self.mongo_write_concern_timeout_ms = int(os.getenv("MONGO_WRITE_CONCERN_TIMEOUT_MS", "0"))
+        self.readiness_timeout = float(os.getenv("READINESS_TIMEOUT", "2"))
+        # the DB ping, index sync and first revocation sync always finish before the worker serves;
+        # they are retried with backoff for this long before startup gives up
+        self.startup_db_timeout = float(os.getenv("STARTUP_DB_TIMEOUT", "60"))
+        # "background": serve once the database is prepared, /ready turns 200 after the bcrypt
+        # backend is loaded; "blocking": load it before the worker accepts requests too
+        self.startup_warmup = os.getenv("STARTUP_WARMUP", "background")
+
+
+settings = Settings()
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# app modules import each other as top-level packages (routes, model, jwt_auth, ...)
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+os.environ.setdefault("secret", "benchmark-secret-at-least-32-bytes-long")
+os.environ.setdefault("algorithm", "HS256")
@@ -0,0 +1,87 @@
+"""Registration input validation throughput: the old per-request regex checks vs
+the precompiled single-pass rules, alone and through UserCreate.
+
+    python benchmarks/bench_credential_validation.py --payloads 200000
+"""
+import argparse
+import json
+import random
+import re
+import string
+import time
+
+import _app_path  # noqa: F401
+from pydantic import ValidationError
+from schemas.credential_validation import password_failures, username_failures
+from schemas.user_schema import UserCreate
+
+
+def legacy_check(username: str, password: str) -> bool:
+    # the checks register() used to run, minus the exceptions
+    return bool(
+        re.match(r"^[a-zA-Z0-9_]+$", username)
+        and len(password) >= 8
+        and re.search(r"\d", password)
+        and re.search(r"[a-z]", password)
+        and re.search(r"[A-Z]", password)
+        and re.search(r"[!@#$%^&*(),.?\":{}|<>]", password)
+    )
+
+
+def single_pass_check(username: str, password: str) -> bool:
+    return not username_failures(username) and not password_failures(password)
+
+
+def model_check(payload: dict) -> bool:
+    try:
+        UserCreate.model_validate(payload)
+        return True
+    except ValidationError:
+        return False
+
+
+def build_payloads(count: int, invalid_ratio: float, seed: int):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits
+    payloads = []
+    for i in range(count):
+        password = "".join(rng.choices(alphabet, k=rng.randint(8, 24))) + "aA1!"
+        username = f"user_{i}"
+        if rng.random() < invalid_ratio:
+            if rng.random() < 0.5:
+                password = password.replace("!", "").lower()
+            else:
+                username += "-x"
+        payloads.append({"username": username, "password": password, "role": "user"})
+    return payloads
+
+
+def run(check, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        check(item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payloads", type=int, default=200000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.payloads, args.invalid_ratio, args.seed)
+    pairs = [(p["username"], p["password"]) for p in payloads]
+    assert [legacy_check(*pair) for pair in pairs] == [single_pass_check(*pair) for pair in pairs]
+
+    print(json.dumps({
+        "payloads": args.payloads,
+        "invalid_ratio": args.invalid_ratio,
+        "legacy_regex_per_s": round(run(lambda pair: legacy_check(*pair), pairs)),
+        "single_pass_per_s": round(run(lambda pair: single_pass_check(*pair), pairs)),
+        "user_create_model_per_s": round(run(model_check, payloads)),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
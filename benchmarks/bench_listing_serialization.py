@@ -0,0 +1,99 @@
+"""Per-row CPU and memory of the /getprojects serialization paths.
+
+hydrated  Project._from_son -> dict -> GetProjectsResponse -> JSON (the old path)
+raw       projected row dict -> orjson bytes (the current fast path)
+
+Runs in-process on synthetic rows shaped like Mongo output, so no database is needed.
+
+    python benchmarks/bench_listing_serialization.py
+"""
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import orjson
+from bson import ObjectId
+
+import _app_path  # noqa: F401
+from model.project_model import Project
+from schemas.project_schema_response_model import GetProjectsResponse
+
+
+def make_rows(count: int):
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"project-{i}",
+            "description": "A reasonably sized project description for benchmarking.",
+            "created_by": "admin1",
+            "created_at": start + timedelta(seconds=i),
+        }
+        for i in range(count)
+    ]
+
+
+def hydrated(rows):
+    projects = [Project._from_son(dict(row)) for row in rows]
+    project_list = [
+        {
+            "id": str(project.id),
+            "name": project.name,
+            "description": project.description,
+            "created_by": project.created_by,
+            "created_at": project.created_at,
+        }
+        for project in projects
+    ]
+    response = GetProjectsResponse(
+        message="Project Details Fetched Successfully",
+        projects=project_list,  # type: ignore
+        total_project=len(rows),
+        page=1,
+        page_size=len(rows),
+    )
+    return response.model_dump_json().encode()
+
+
+def raw(rows):
+    projects = [dict(row) for row in rows]  # copies stand in for fresh driver output
+    for project in projects:
+        project["id"] = str(project.pop("_id"))
+    return orjson.dumps({
+        "message": "Project Details Fetched Successfully",
+        "projects": projects,
+        "total_project": len(rows),
+        "total_project_exact": True,
+        "page": 1,
+        "page_size": len(rows),
+        "next_cursor": None,
+    })
+
+
+def measure(fn, rows, repeat: int):
+    fn(rows)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(rows)
+    cpu_us = (time.perf_counter() - start) / repeat / len(rows) * 1e6
+    tracemalloc.start()
+    fn(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return round(cpu_us, 2), round(peak / len(rows))
+
+
+def main():
+    results = []
+    for page_size in (10, 100, 1000):
+        rows = make_rows(page_size)
+        repeat = max(5, 20000 // page_size)
+        for name, fn in (("hydrated", hydrated), ("raw", raw)):
+            cpu_us, peak_bytes = measure(fn, rows, repeat)
+            results.append({"page_size": page_size, "path": name, "cpu_us_per_row": cpu_us, "peak_bytes_per_row": peak_bytes})
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
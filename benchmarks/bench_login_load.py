@@ -0,0 +1,72 @@
+"""Login latency under concurrent load against a running server.
+
+Registers one account, then has N concurrent clients log in repeatedly and
+reports throughput, p50/p95/p99 latency and how many requests were shed with 503.
+Every client logs in from the same address, so start the server with the login
+rate limits off (or raised well above --clients x --requests-per-client);
+otherwise most requests are answered 429 and the numbers measure the limiter.
+
+    RATE_LIMIT_ENABLED=false uvicorn main:app --app-dir app --port 8000
+    python benchmarks/bench_login_load.py --url http://127.0.0.1:8000 --clients 200
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+def percentile(samples, pct):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def client_loop(http, credentials, requests, latencies, statuses):
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await http.post("/login", json=credentials)
+        latencies.append((time.perf_counter() - start) * 1000)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests-per-client", type=int, default=5)
+    args = parser.parse_args()
+
+    credentials = {"username": f"bench_{uuid.uuid4().hex[:8]}", "password": "Bench@12345"}
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as http:
+        await http.post("/register", json=dict(credentials, role="user"))
+        latencies, statuses = [], {}
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            client_loop(http, credentials, args.requests_per_client, latencies, statuses)
+            for _ in range(args.clients)
+        ))
+        elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        "clients": args.clients,
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies), 1),
+            "p50": round(percentile(latencies, 50), 1),
+            "p95": round(percentile(latencies, 95), 1),
+            "p99": round(percentile(latencies, 99), 1),
+        },
+        "statuses": statuses,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
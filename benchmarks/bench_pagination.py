@@ -0,0 +1,76 @@
+"""Deep-page latency: skip/limit vs keyset cursor on /getprojects queries.
+
+Seeds the projects collection up to --projects documents (default 1M) in the
+database named by MONGODB_URL, then times fetching one page at increasing depths
+with both ProjectRepository.list_page_rows and ProjectRepository.list_after_rows,
+the projected queries /getprojects runs.
+
+    MONGODB_URL=mongodb://localhost:27017/bench python benchmarks/bench_pagination.py
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import _app_path  # noqa: F401
+from db import connect_db
+from repository.project_repository import project_repository
+from repository.pagination import encode_cursor, decode_cursor
+
+
+async def seed(total: int, batch: int = 10000):
+    existing = await project_repository.collection.estimated_document_count()
+    start = datetime(2020, 1, 1)
+    for offset in range(existing, total, batch):
+        docs = [
+            {
+                "name": f"bench-project-{i}",
+                "description": "benchmark project",
+                "created_by": "bench",
+                "created_at": start + timedelta(seconds=i),
+            }
+            for i in range(offset, min(offset + batch, total))
+        ]
+        await project_repository.collection.insert_many(docs, ordered=False)
+    await project_repository.ensure_indexes()
+
+
+async def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    await connect_db()
+    await seed(args.projects)
+    results = []
+    for depth in (1, 100, 1000, 5000, 9000):
+        offset = (depth - 1) * args.page_size
+        if offset >= args.projects:
+            break
+        after = None
+        if offset:
+            previous = (await project_repository.list_page_rows(offset - 1, 1))[0]
+            after = decode_cursor(encode_cursor(previous["created_at"], previous["_id"]))
+        results.append({
+            "page": depth,
+            "skip_limit_ms": round(await timed(lambda: project_repository.list_page_rows(offset, args.page_size), args.repeat), 2),
+            "cursor_ms": round(await timed(lambda: project_repository.list_after_rows(after, args.page_size), args.repeat), 2),
+        })
+    print(json.dumps({"projects": args.projects, "page_size": args.page_size, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+"""/searchprojects query plans and latency on a large collection.
+
+Seeds the projects collection up to --projects documents in the database named
+by MONGODB_URL (explain needs a real server), then for each search shape checks
+the winning plan and times one page. Exits non-zero if any plan scans the whole
+collection (COLLSCAN) or examines far more index keys than it returns.
+
+    MONGODB_URL=mongodb://localhost:27017/bench python benchmarks/bench_search.py
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import _app_path  # noqa: F401
+from db import connect_db, get_database
+from repository.indexes import sync_indexes
+from repository.project_repository import project_repository
+
+WORDS = ["alpha", "billing", "cloud", "data", "edge", "finance", "gateway", "health", "infra", "journal",
+         "kernel", "ledger", "mobile", "network", "orders", "payments", "queue", "reports", "search", "telemetry"]
+OWNERS = [f"tenant{i}" for i in range(50)]
+
+
+async def seed(total: int, batch: int = 10000):
+    existing = await project_repository.collection.estimated_document_count()
+    rng = random.Random(existing)
+    start = datetime(2020, 1, 1)
+    for offset in range(existing, total, batch):
+        docs = []
+        for i in range(offset, min(offset + batch, total)):
+            words = rng.sample(WORDS, 3)
+            docs.append({
+                "name": f"{words[0]}-{i}",
+                "description": f"{words[1]} {words[2]} project",
+                "created_by": OWNERS[i % len(OWNERS)],
+                "created_at": start + timedelta(seconds=i),
+            })
+        await project_repository.collection.insert_many(docs, ordered=False)
+    await sync_indexes(create=True)
+
+
+def winning_stages(node, stages=None):
+    """Every stage name inside the winning plan(s) of an explain document."""
+    if stages is None:
+        stages = []
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "winningPlan":
+                collect_stages(value, stages)
+            elif key != "rejectedPlans":
+                winning_stages(value, stages)
+    elif isinstance(node, list):
+        for item in node:
+            winning_stages(item, stages)
+    return stages
+
+
+def collect_stages(node, stages):
+    if isinstance(node, dict):
+        if "stage" in node:
+            stages.append(node["stage"])
+        for value in node.values():
+            collect_stages(value, stages)
+    elif isinstance(node, list):
+        for item in node:
+            collect_stages(item, stages)
+
+
+def find_number(node, key: str) -> int:
+    if isinstance(node, dict):
+        if key in node and isinstance(node[key], int):
+            return node[key]
+        return max((find_number(value, key) for value in node.values()), default=0)
+    if isinstance(node, list):
+        return max((find_number(item, key) for item in node), default=0)
+    return 0
+
+
+async def explain(pipeline: list) -> dict:
+    command = {"aggregate": project_repository.collection.name, "pipeline": pipeline, "cursor": {}}
+    return await get_database().command("explain", command, verbosity="executionStats")
+
+
+async def check(label: str, query: dict, order: str, page_size: int, repeat: int, max_keys_per_row: int):
+    first = await project_repository.search_rows(query, order, None, page_size)
+    after = (first[-1][order], first[-1]["_id"]) if len(first) == page_size else None
+    result = {"search": label}
+    for page, cursor in (("first", None), ("second", after)):
+        pipeline = project_repository.search_pipeline(query, order, cursor, page_size)
+        plan = await explain(pipeline)
+        stages = winning_stages(plan)
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await project_repository.search_rows(query, order, cursor, page_size)
+            samples.append((time.perf_counter() - start) * 1000)
+        keys = find_number(plan, "totalKeysExamined")
+        docs = find_number(plan, "totalDocsExamined")
+        returned = max(1, find_number(plan, "nReturned"))
+        problems = []
+        if "COLLSCAN" in stages:
+            problems.append("COLLSCAN")
+        # text relevance has to score every match, so only the ordered scans are held to the ratio
+        if order != "score" and keys > max_keys_per_row * returned:
+            problems.append(f"examined {keys} keys for {returned} rows")
+        result[page] = {"ms": round(statistics.median(samples), 2), "stages": sorted(set(stages)),
+                        "keys_examined": keys, "docs_examined": docs, "problems": problems}
+    return result
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-keys-per-row", type=int, default=20)
+    args = parser.parse_args()
+
+    await connect_db()
+    await seed(args.projects)
+    search = project_repository.search_filter
+    since = datetime(2020, 1, 1) + timedelta(seconds=args.projects // 2)
+    shapes = [
+        ("text", search(text="billing cloud"), "score"),
+        ("text + created_by", search(text="ledger", created_by=OWNERS[3]), "score"),
+        ("name prefix", search(name_prefix="gateway-1"), "name"),
+        ("name prefix + created_at range", search(name_prefix="edge-", created_after=since), "name"),
+        ("created_by", search(created_by=OWNERS[7]), "created_at"),
+        ("created_by + created_at range", search(created_by=OWNERS[7], created_after=since), "created_at"),
+        ("created_at range", search(created_after=since), "created_at"),
+    ]
+    results = [await check(label, query, order, args.page_size, args.repeat, args.max_keys_per_row)
+               for label, query, order in shapes]
+    print(json.dumps({"projects": args.projects, "page_size": args.page_size, "results": results}, indent=2))
+    if any(r[page]["problems"] for r in results for page in ("first", "second")):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
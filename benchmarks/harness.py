@@ -0,0 +1,218 @@
+"""Load-test harness for the auth and project endpoints.
+
+Runs the FastAPI app in-process (httpx ASGITransport, lifespan included) against an
+in-memory Mongo stand-in (mongomock_motor) or a real server via --mongo-url,
+seeds users and projects, then drives each scenario at the requested concurrency.
+
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/harness.py --users 200 --projects 20000 --concurrency 50 --save results.json
+    python benchmarks/harness.py --baseline results.json --threshold 0.15
+
+To check the metrics overhead, save a run with --no-metrics and compare a normal run to it:
+
+    python benchmarks/harness.py --no-metrics --save metrics-off.json
+    python benchmarks/harness.py --baseline metrics-off.json --threshold 0.02
+
+Listing scenarios run with the response cache off, so they time the page queries; the
+"_cached" variants repeat them with the cache on.
+
+Results are JSON: per scenario, request count, errors, throughput and p50/p95/p99 latency (ms).
+With --baseline, scenarios whose p95 rose or throughput fell by more than --threshold are
+reported as regressions and the process exits with status 1.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import _app_path  # noqa: F401
+
+PASSWORD = "Bench@12345"
+
+
+def configure_environment(args):
+    # must happen before any app module reads its settings
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ["BCRYPT_ROUNDS"] = str(args.bcrypt_rounds)
+    os.environ["METRICS_ENABLED"] = "false" if args.no_metrics else "true"
+    if args.mongo_url:
+        os.environ["MONGODB_URL"] = args.mongo_url
+
+
+def use_in_memory_database():
+    # before main is imported, so connect_db skips the server connection
+    from mongomock_motor import AsyncMongoMockClient
+    import db
+    db.set_database(AsyncMongoMockClient()["bench"])
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def summarize(latencies, errors, elapsed):
+    if not latencies:
+        return {"requests": 0, "errors": errors}
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+async def run_scenario(make_request, total: int, concurrency: int, expected=(200,)):
+    """make_request(i) returns an awaitable httpx response; runs total of them, concurrency at a time."""
+    latencies, errors = [], 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            response = await make_request(i)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code not in expected:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+async def seed(users: int, projects: int):
+    from model.user_model import User, get_pwd_context
+    from repository.user_repository import user_repository
+    from repository.project_repository import project_repository
+
+    password_hash = get_pwd_context().hash(PASSWORD)
+    admin = User(username="bench_admin", role="admin", password=password_hash)
+    await user_repository.insert(admin)
+    names = [f"bench_user_{i}" for i in range(users)]
+    await user_repository.collection.insert_many(
+        [{"username": name, "password": password_hash, "role": "user", "token_version": 0} for name in names]
+    )
+    start = datetime(2020, 1, 1)
+    for offset in range(0, projects, 10000):
+        await project_repository.collection.insert_many([
+            {"name": f"seed-project-{i}", "description": "seeded for benchmarking",
+             "created_by": "bench_admin", "created_at": start + timedelta(seconds=i)}
+            for i in range(offset, min(offset + 10000, projects))
+        ])
+    return names
+
+
+async def run(args):
+    import httpx
+    if not args.mongo_url:
+        use_in_memory_database()
+    from main import app
+    from services.response_cache import project_list_cache
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        if app.state.warmup is not None:
+            # loads the bcrypt backend so it is not timed in the first login
+            await app.state.warmup
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            usernames = await seed(args.users, args.projects)
+            login = await http.post("/login", json={"username": "bench_admin", "password": PASSWORD})
+            headers = {"Authorization": f"Bearer {login.json()['token']}"}
+            n, c = args.requests, args.concurrency
+            run_id = uuid.uuid4().hex[:6]
+
+            results["register"] = await run_scenario(lambda i: http.post("/register", json={
+                "username": f"reg_{run_id}_{i}", "password": PASSWORD, "role": "user"}), n, c)
+            results["login"] = await run_scenario(lambda i: http.post("/login", json={
+                "username": random.choice(usernames), "password": PASSWORD}), n, c)
+            results["createproject"] = await run_scenario(lambda i: http.post("/createproject", headers=headers, json={
+                "title": f"bench-{run_id}-{i}", "description": "created by harness"}), n, c)
+
+            # without the response cache every request runs the page query; "_cached" variants show the cache
+            cache_budget = project_list_cache.max_bytes
+            for suffix, max_bytes in (("", 0), ("_cached", cache_budget)):
+                project_list_cache.max_bytes = max_bytes
+                project_list_cache.bump()
+                for page_size in args.page_sizes:
+                    last_page = max(1, (args.projects + n) // page_size)
+                    for label, page in (("first", 1), ("deep", last_page)):
+                        results[f"getprojects_page_{label}_{page_size}{suffix}"] = await run_scenario(
+                            lambda i, page=page, page_size=page_size: http.get(
+                                "/getprojects", headers=headers, params={"page": page, "page_size": page_size, "count": args.count_mode}),
+                            n, c, expected=(200, 404))
+                    cursor = await deep_cursor(http, headers, page_size, last_page)
+                    results[f"getprojects_cursor_deep_{page_size}{suffix}"] = await run_scenario(
+                        lambda i, cursor=cursor, page_size=page_size: http.get(
+                            "/getprojects", headers=headers, params={"cursor": cursor, "page_size": page_size, "count": args.count_mode}),
+                        n, c, expected=(200, 404))
+            project_list_cache.max_bytes = cache_budget
+
+            created = await http.get("/getprojects", headers=headers, params={"page": 1, "page_size": 100})
+            ids = [p["id"] for p in created.json()["projects"]]
+            results["updateproject"] = await run_scenario(lambda i: http.patch(
+                f"/updateproject/{ids[i % len(ids)]}", headers=headers, json={"description": f"updated {i}"}), n, c)
+            results["delete"] = await run_scenario(lambda i: http.delete(
+                f"/delete/{ids[i]}", headers=headers), min(n, len(ids)), c)
+    return results
+
+
+async def deep_cursor(http, headers, page_size: int, page: int):
+    response = await http.get("/getprojects", headers=headers, params={"page": max(1, page - 1), "page_size": page_size})
+    return response.json().get("next_cursor") if response.status_code == 200 else None
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    regressions = []
+    for scenario, current in results.items():
+        previous = baseline.get(scenario)
+        if not previous or "p95_ms" not in previous or "p95_ms" not in current:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + threshold):
+            regressions.append(f"{scenario}: p95 {previous['p95_ms']}ms -> {current['p95_ms']}ms")
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - threshold):
+            regressions.append(f"{scenario}: throughput {previous['throughput_rps']} -> {current['throughput_rps']} rps")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--count-mode", default="exact", choices=["exact", "cached", "estimated"])
+    parser.add_argument("--bcrypt-rounds", type=int, default=int(os.getenv("BCRYPT_ROUNDS", "12")))
+    parser.add_argument("--mongo-url", help="real MongoDB to use instead of the in-memory stand-in")
+    parser.add_argument("--no-metrics", action="store_true", help="run with METRICS_ENABLED=false")
+    parser.add_argument("--save", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative regression")
+    args = parser.parse_args()
+
+    configure_environment(args)
+    results = asyncio.run(run(args))
+    output = {"config": vars(args), "results": results}
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            output["regressions"] = compare(results, json.load(f)["results"], args.threshold)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(output, f, indent=2)
+    print(json.dumps(output, indent=2))
+    if output.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
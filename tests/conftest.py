@@ -0,0 +1,33 @@
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import pytest
+
+# app modules import each other as top-level packages (routes, model, jwt_auth, ...)
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+os.environ.setdefault("secret", "test-secret-that-is-at-least-32-bytes-long")
+os.environ.setdefault("algorithm", "HS256")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# rate limits are covered by test_rate_limiter.py; elsewhere they would only make tests order-dependent
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+
+@pytest.fixture
+def api():
+    """Async context manager yielding an httpx client for a fresh app on an empty in-memory database."""
+    @asynccontextmanager
+    async def client():
+        import httpx
+        from mongomock_motor import AsyncMongoMockClient
+        import db
+        db.set_database(AsyncMongoMockClient()["test"])
+        from main import create_app
+        app = create_app()
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+                yield http
+    return client
@@ -0,0 +1,115 @@
+"""Insert/update/delete round-trips through BaseRepository against mongomock_motor.
+
+    pip install -r tests/requirements.txt
+    python -m pytest tests
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from mongoengine.errors import ValidationError
+from pymongo.errors import DuplicateKeyError
+from mongomock_motor import AsyncMongoMockClient
+
+from model.project_model import Project
+from repository.base_repository import BaseRepository
+
+
+class RecordingProjectRepository(BaseRepository):
+    document = Project
+
+    def __init__(self, database):
+        super().__init__(database)
+        self.events = []
+
+    def after_insert(self, doc):
+        self.events.append(("insert", doc.name))
+
+    def after_update(self, doc, changed_fields):
+        self.events.append(("update", sorted(changed_fields)))
+
+    def after_delete(self, doc):
+        self.events.append(("delete", doc.name))
+
+
+@pytest.fixture
+def repository():
+    return RecordingProjectRepository(AsyncMongoMockClient()["test"])
+
+
+def new_project(name="alpha"):
+    return Project(name=name, description="first", created_by="alice", created_at=datetime(2024, 1, 1))
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_insert_assigns_id_and_round_trips(repository):
+    project = run(repository.insert(new_project()))
+
+    assert project.id is not None
+    assert project._get_changed_fields() == []
+    stored = run(repository.get_by_id(str(project.id)))
+    assert isinstance(stored, Project)
+    assert (stored.name, stored.description, stored.created_by) == ("alpha", "first", "alice")
+    assert stored.created_at == datetime(2024, 1, 1)
+    assert repository.events == [("insert", "alpha")]
+
+
+def test_insert_validates_before_writing(repository):
+    with pytest.raises(ValidationError):
+        run(repository.insert(Project(name="missing description", created_by="alice")))
+    assert run(repository.collection.count_documents({})) == 0
+
+
+def test_update_sends_only_changed_fields(repository):
+    project = run(repository.insert(new_project()))
+    project.description = "second"
+    run(repository.update(project))
+
+    son = run(repository.collection.find_one({"_id": project.id}))
+    assert son["description"] == "second"
+    assert son["name"] == "alpha"
+    assert "owner_id" not in son
+    assert repository.events[-1] == ("update", ["description"])
+
+
+def test_update_unsets_cleared_fields(repository):
+    project = new_project()
+    project.owner_id = ObjectId()
+    run(repository.insert(project))
+    project.owner_id = None
+    run(repository.update(project))
+
+    son = run(repository.collection.find_one({"_id": project.id}))
+    assert "owner_id" not in son
+    assert son["name"] == "alpha"
+
+
+def test_update_without_changes_writes_nothing(repository):
+    project = run(repository.insert(new_project()))
+    run(repository.collection.update_one({"_id": project.id}, {"$set": {"description": "elsewhere"}}))
+    run(repository.update(project))
+
+    assert run(repository.get_by_id(project.id)).description == "elsewhere"
+
+
+def test_delete_removes_document(repository):
+    project = run(repository.insert(new_project()))
+    run(repository.delete(project))
+
+    assert run(repository.get_by_id(project.id)) is None
+    assert repository.events[-1] == ("delete", "alpha")
+
+
+def test_get_by_id_rejects_malformed_ids(repository):
+    assert run(repository.get_by_id("not-an-object-id")) is None
+
+
+def test_unique_index_from_document_meta(repository):
+    run(repository.ensure_indexes())
+    run(repository.insert(new_project()))
+    with pytest.raises(DuplicateKeyError):
+        run(repository.insert(new_project()))
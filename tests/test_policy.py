@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from jwt_auth.policy import DEFAULT_POLICY, REQUIRED_PERMISSIONS, compile_policy, load_policy
+
+
+def has(bits, masks, role, permission):
+    return bool(masks.get(role, 0) & bits[permission])
+
+
+def test_default_policy_masks():
+    bits, masks = compile_policy(DEFAULT_POLICY)
+
+    assert len(set(bits.values())) == len(bits)
+    for permission in REQUIRED_PERMISSIONS:
+        assert has(bits, masks, "admin", permission)
+    assert has(bits, masks, "user", "projects:read")
+    assert has(bits, masks, "user", "projects:update:own")
+    assert not has(bits, masks, "user", "projects:create")
+    assert not has(bits, masks, "user", "projects:update")
+    assert not has(bits, masks, "user", "diagnostics:read")
+    # inherited from user
+    assert has(bits, masks, "admin", "projects:delete:own")
+
+
+def test_custom_policy_file(tmp_path):
+    policy = dict(DEFAULT_POLICY, auditor={"inherits": ["user"], "permissions": ["projects:export"]})
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps(policy))
+
+    bits, masks = compile_policy(load_policy(str(path)))
+
+    assert has(bits, masks, "auditor", "projects:export")
+    assert has(bits, masks, "auditor", "projects:read")
+    assert not has(bits, masks, "auditor", "projects:delete")
+
+
+def test_policy_missing_required_permissions_names_them(tmp_path):
+    path = tmp_path / "old_policy.json"
+    path.write_text(json.dumps({
+        "user": {"permissions": ["projects:read"]},
+        "admin": {"inherits": ["user"], "permissions": ["projects:create", "projects:update", "projects:delete"]},
+    }))
+
+    with pytest.raises(ValueError) as error:
+        compile_policy(load_policy(str(path)))
+    assert "projects:export, diagnostics:read" in str(error.value)
+
+
+def test_unknown_parent_role():
+    with pytest.raises(ValueError, match="Unknown role 'staff'"):
+        compile_policy({"user": {"inherits": ["staff"], "permissions": ["projects:read"]}}, required=())
+
+
+def test_circular_inheritance():
+    with pytest.raises(ValueError, match="a -> b -> a"):
+        compile_policy({"a": {"inherits": ["b"]}, "b": {"inherits": ["a"]}}, required=())
+
+
+def test_role_checks_against_loaded_policy():
+    from jwt_auth.policy import is_known_role, permission_bit, role_has
+
+    assert role_has("admin", permission_bit("projects:export"))
+    assert not role_has("user", permission_bit("projects:export"))
+    assert not role_has("nobody", permission_bit("projects:read"))
+    assert is_known_role("user") and not is_known_role("nobody")
+    with pytest.raises(ValueError, match="projects:archive"):
+        permission_bit("projects:archive")
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from exceptions.user_exception import TooManyRequestsException
+from services import rate_limiter as rate_limiting
+from services.rate_limiter import InMemorySlidingWindowBackend, RateLimit, RateLimiter
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock, monkeypatch):
+    monkeypatch.setattr(rate_limiting, "RATE_LIMIT_ENABLED", True)
+    return RateLimiter(InMemorySlidingWindowBackend(clock=clock))
+
+
+def hits(backend, key, n, limit=3, window=60.0):
+    return [run(backend.hit(key, limit, window)) for _ in range(n)]
+
+
+def test_allows_up_to_limit_then_reports_time_left(clock):
+    backend = InMemorySlidingWindowBackend(clock=clock)
+    clock.now = 1200.0 + 15  # 15s into a 60s window
+
+    assert hits(backend, "ip:a", 4) == [0, 0, 0, 45.0]
+    # other keys are counted separately
+    assert hits(backend, "ip:b", 1) == [0]
+
+
+def test_previous_window_is_weighted_by_its_overlap(clock):
+    backend = InMemorySlidingWindowBackend(clock=clock)
+    clock.now = 1200.0
+    hits(backend, "k", 3)
+
+    # a quarter into the next window, 3 * 0.75 = 2.25 of the limit of 3 is still used
+    clock.now = 1260.0 + 15
+    assert hits(backend, "k", 2) == [0, 45.0]
+
+    # two windows later nothing carries over
+    clock.now = 1380.0
+    assert hits(backend, "k", 3) == [0, 0, 0]
+
+
+def test_count_false_checks_without_recording(clock):
+    backend = InMemorySlidingWindowBackend(clock=clock)
+    clock.now = 1200.0
+
+    assert run(backend.hit("k", 1, 60.0, count=False)) == 0
+    assert run(backend.hit("k", 1, 60.0, count=False)) == 0
+    # unseen keys are not stored by read-only checks
+    assert "k" not in backend._windows
+    assert hits(backend, "k", 2, limit=1) == [0, 60.0]
+
+
+def test_least_recently_used_keys_are_dropped(clock):
+    backend = InMemorySlidingWindowBackend(max_keys=2, clock=clock)
+    clock.now = 1200.0
+    for key in ("a", "b", "c"):
+        hits(backend, key, 1, limit=1)
+
+    assert list(backend._windows) == ["b", "c"]
+    # "a" was forgotten, so it starts from zero
+    assert hits(backend, "a", 1, limit=1) == [0]
+
+
+def test_check_raises_429_with_retry_after(limiter, clock):
+    rule = RateLimit("login_ip", 2, 60)
+    clock.now = 1200.5
+    run(limiter.check(rule, "10.0.0.1"))
+    run(limiter.check(rule, "10.0.0.1"))
+
+    with pytest.raises(TooManyRequestsException) as error:
+        run(limiter.check(rule, "10.0.0.1"))
+    assert error.value.status_code == 429
+    assert error.value.headers == {"Retry-After": "60"}
+    assert limiter.rejected == 1
+
+    clock.now = 1200.5 + 120
+    run(limiter.check(rule, "10.0.0.1"))
+
+
+def test_record_counts_without_raising(limiter, clock):
+    rule = RateLimit("login_username", 2, 60)
+    clock.now = 1200.0
+    for _ in range(3):
+        run(limiter.record(rule, "alice"))
+
+    with pytest.raises(TooManyRequestsException):
+        run(limiter.check(rule, "alice", count=False))
+    run(limiter.check(rule, "bob", count=False))
+
+
+def test_disabled_limiter_never_raises(clock, monkeypatch):
+    monkeypatch.setattr(rate_limiting, "RATE_LIMIT_ENABLED", False)
+    limiter = RateLimiter(InMemorySlidingWindowBackend(clock=clock))
+    for _ in range(10):
+        run(limiter.check(RateLimit("login_ip", 1, 60), "10.0.0.1"))
+
+
+def test_login_limits_per_ip_and_failed_logins_per_username(api, clock, monkeypatch):
+    monkeypatch.setattr(rate_limiting, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(rate_limiting.rate_limiter, "backend", InMemorySlidingWindowBackend(clock=clock))
+    monkeypatch.setattr(rate_limiting.LOGIN_IP, "limit", 8)
+    monkeypatch.setattr(rate_limiting.LOGIN_USERNAME, "limit", 2)
+    monkeypatch.setattr(rate_limiting.REGISTER_IP, "limit", 100)
+    password = "Passw0rd@test"
+
+    async def scenario():
+        async with api() as http:
+            await http.post("/register", json={"username": "carol", "password": password})
+            login = lambda pw: http.post("/login", json={"username": "carol", "password": pw})
+
+            # successful logins only count against the IP
+            assert [(await login(password)).status_code for _ in range(3)] == [200, 200, 200]
+            # two failures use up the username's allowance; even the right password is refused now
+            assert [(await login("Wr0ng@pass")).status_code for _ in range(2)] == [400, 400]
+            refused = await login(password)
+            assert refused.status_code == 429
+            assert int(refused.headers["Retry-After"]) >= 1
+
+            clock.now += 120
+            assert (await login(password)).status_code == 200
+            # the per-IP limit of 8 still applies across usernames
+            statuses = [(await http.post("/login", json={"username": f"ghost{i}", "password": password})).status_code
+                        for i in range(9)]
+            assert statuses == [404] * 7 + [429] * 2
+    run(scenario())
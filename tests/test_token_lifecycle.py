@@ -0,0 +1,149 @@
+"""Refresh rotation, reuse detection, logout and token-version revocation through the HTTP API."""
+import asyncio
+from datetime import datetime, timedelta
+
+from jwt_auth import token_revocation
+from services import revocation_sync
+
+PASSWORD = "Passw0rd@test"
+NEW_PASSWORD = "N3w-Passw0rd@test"
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def login(http, username, password=PASSWORD):
+    response = await http.post("/login", json={"username": username, "password": password})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def register_and_login(http, username):
+    response = await http.post("/register", json={"username": username, "password": PASSWORD, "role": "admin"})
+    assert response.status_code == 200, response.text
+    tokens = await login(http, username)
+    # one owned project, so /myprojects answers 200 for a token that is still accepted
+    response = await http.post("/createproject", headers=bearer(tokens["token"]), json={"title": f"{username}-project", "description": "d"})
+    assert response.status_code == 200, response.text
+    return tokens
+
+
+def bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def refresh(http, refresh_token):
+    return await http.post("/token/refresh", json={"refresh_token": refresh_token})
+
+
+async def access(http, token):
+    return await http.get("/myprojects", headers=bearer(token))
+
+
+def assert_revoked(response):
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+async def simulate_other_worker():
+    """Forgets this process's revocations and rebuilds them from the database, as a fresh worker would."""
+    token_revocation._min_token_versions.clear()
+    token_revocation._revoked_jtis.clear()
+    revocation_sync._last_synced_at = None
+    await revocation_sync.sync_revoked_tokens()
+
+
+def test_refresh_rotates_and_replay_revokes_family(api):
+    async def scenario():
+        async with api() as http:
+            tokens = await register_and_login(http, "rotate")
+
+            rotated = await refresh(http, tokens["refresh_token"])
+            assert rotated.status_code == 200
+            rotated = rotated.json()
+            assert rotated["refresh_token"] != tokens["refresh_token"]
+            assert (await access(http, rotated["token"])).status_code == 200
+
+            replayed = await refresh(http, tokens["refresh_token"])
+            assert replayed.status_code == 401
+            assert replayed.json()["error_code"] == "INVALID_REFRESH_TOKEN"
+            # the replay means the chain leaked, so the legitimately rotated token dies too
+            assert (await refresh(http, rotated["refresh_token"])).status_code == 401
+
+            # other logins are separate families
+            other = await login(http, "rotate")
+            assert (await refresh(http, other["refresh_token"])).status_code == 200
+    run(scenario())
+
+
+def test_unknown_refresh_token_is_rejected(api):
+    async def scenario():
+        async with api() as http:
+            assert (await refresh(http, "not-a-token")).status_code == 401
+    run(scenario())
+
+
+def test_logout_revokes_access_token_and_refresh_family(api):
+    async def scenario():
+        async with api() as http:
+            tokens = await register_and_login(http, "leaver")
+            other = await login(http, "leaver")
+
+            response = await http.post("/logout", headers=bearer(tokens["token"]), json={"refresh_token": tokens["refresh_token"]})
+            assert response.status_code == 200
+
+            assert_revoked(await access(http, tokens["token"]))
+            assert (await refresh(http, tokens["refresh_token"])).status_code == 401
+            # only the logged-out token and family are affected
+            assert (await access(http, other["token"])).status_code == 200
+            assert (await refresh(http, other["refresh_token"])).status_code == 200
+
+            await simulate_other_worker()
+            assert_revoked(await access(http, tokens["token"]))
+    run(scenario())
+
+
+def test_jti_revoked_by_another_worker_is_synced(api):
+    async def scenario():
+        async with api() as http:
+            tokens = await register_and_login(http, "synced")
+            from jwt_auth.token_security import decode_jwt
+            from repository.token_repository import revoked_token_repository
+            payload = decode_jwt(tokens["token"])
+            await revoked_token_repository.add(payload["jti"], datetime.utcnow() + timedelta(minutes=5))
+            assert (await access(http, tokens["token"])).status_code == 200
+
+            await revocation_sync.sync_revoked_tokens()
+            assert_revoked(await access(http, tokens["token"]))
+    run(scenario())
+
+
+def test_change_password_invalidates_earlier_tokens(api):
+    async def scenario():
+        async with api() as http:
+            tokens = await register_and_login(http, "changer")
+
+            wrong = await http.post("/changepassword", headers=bearer(tokens["token"]),
+                                    json={"current_password": "Wr0ng@password", "new_password": NEW_PASSWORD})
+            assert wrong.status_code == 400
+            assert (await access(http, tokens["token"])).status_code == 200
+
+            changed = await http.post("/changepassword", headers=bearer(tokens["token"]),
+                                      json={"current_password": PASSWORD, "new_password": NEW_PASSWORD})
+            assert changed.status_code == 200
+            changed = changed.json()
+
+            assert_revoked(await access(http, tokens["token"]))
+            assert (await refresh(http, tokens["refresh_token"])).status_code == 401
+            assert (await access(http, changed["token"])).status_code == 200
+            assert (await refresh(http, changed["refresh_token"])).status_code == 200
+
+            assert (await http.post("/login", json={"username": "changer", "password": PASSWORD})).status_code == 400
+            await login(http, "changer", NEW_PASSWORD)
+
+            # a worker that never saw the save learns the bump from the user collection
+            await simulate_other_worker()
+            assert_revoked(await access(http, tokens["token"]))
+            assert (await access(http, changed["token"])).status_code == 200
+    run(scenario())